@@ -45,6 +45,21 @@ class SchedulerSettings(BaseSettings):
     timezone: str = Field("UTC", description="Timezone for scheduler operations")
 
 
+class RedisSettings(BaseSettings):
+    """Configuration for the optional Redis backend shared between bot instances."""
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        env_prefix="REDIS_",
+        extra="ignore",
+    )
+
+    url: str | None = Field(
+        None, description="Redis URL for FSM storage and language cache; unset keeps everything in memory"
+    )
+
+
 class AppSettings(BaseSettings):
     """General application settings."""
 
@@ -58,6 +73,7 @@ class AppSettings(BaseSettings):
     bot: BotSettings = Field(default_factory=BotSettings)
     db: DatabaseSettings = Field(default_factory=DatabaseSettings)
     scheduler: SchedulerSettings = Field(default_factory=SchedulerSettings)
+    redis: RedisSettings = Field(default_factory=RedisSettings)
 
     @property
     def log_level_value(self) -> int:
@@ -1,14 +1,19 @@
 from __future__ import annotations
 
-import ast
 import re
 from dataclasses import dataclass, field
+from fractions import Fraction
 from typing import Dict, List
 
+from bot.utils.security import safe_eval
 from bot.utils.validators import validate_username
 
 __all__ = ["DebtParser", "DebtParseError", "ParsedDebt"]
 
+_EXPR_INVALID_CHARS = re.compile(r"[^0-9+\-*/.]")
+_AMOUNT_TOKEN = re.compile(r"[0-9+\-*/.]+")
+_HALF = Fraction(1, 2)
+
 
 class DebtParseError(Exception):
     """Raised when a message cannot be parsed into debts.
@@ -115,7 +120,7 @@ class DebtParser:
         amount_tokens: list[str] = []
         while i < len(tokens):
             tok = tokens[i]
-            if re.fullmatch(r"[0-9+\-*/.]+", tok):
+            if _AMOUNT_TOKEN.fullmatch(tok):
                 amount_tokens.append(tok.replace(',','.'))
                 i += 1
             else:
@@ -128,9 +133,11 @@ class DebtParser:
 
         try:
             amount_value_float = float(DebtParser._safe_eval(amount_expr_raw))
-        except ZeroDivisionError:
-            raise DebtParseError("parser_division_by_zero")
-        except (SyntaxError, TypeError, ValueError):
+        except ValueError as e:
+            if isinstance(e.__cause__, ZeroDivisionError):
+                raise DebtParseError("parser_division_by_zero")
+            raise DebtParseError("parser_invalid_amount_expression")
+        except (SyntaxError, TypeError):
             raise DebtParseError("parser_invalid_amount_expression")
 
         if amount_value_float <= 0:
@@ -163,36 +170,16 @@ class DebtParser:
     @staticmethod
     def _safe_eval(expr: str) -> int:
         """Safely evaluate a simple arithmetic expression."""
-        if re.search(r"[^0-9+\-*/.]", expr):
+        if _EXPR_INVALID_CHARS.search(expr):
             raise TypeError("parser_invalid_characters")
 
-        tree = ast.parse(expr, mode="eval")
-
-        allowed_nodes = {
-            ast.Expression,
-            ast.BinOp,
-            ast.UnaryOp,
-            ast.Constant,
-            ast.Num,
-            ast.Add,
-            ast.Sub,
-            ast.Mult,
-            ast.Div,
-            ast.USub,
-        }
-        for node in ast.walk(tree):
-            if type(node) not in allowed_nodes:
-                raise TypeError("parser_unsafe_node")
-
-        result = eval(
-            compile(tree, filename="", mode="eval")
-        )  # noqa: S307 safe by allowed_nodes
-        if isinstance(result, float):
+        result = safe_eval(expr)
+
+        # Fractional input or division yields a fractional amount, which is rounded
+        # half-up to whole units; a negative fractional total is rejected outright
+        if "." in expr or "/" in expr:
             if result >= 0:
-                result = int(result + 0.5)
-            elif result == 0:
-                raise TypeError("parser_zero_summary")
-            else:
-                raise TypeError("parser_negative_summary")
+                return int(result + _HALF)
+            raise TypeError("parser_negative_summary")
 
         return int(result)
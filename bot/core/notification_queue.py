@@ -0,0 +1,75 @@
+import asyncio
+import logging
+
+from bot.core.notification_service import NotificationService
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationQueue:
+    """
+    Fire-and-forget outbound message queue drained by a single background task.
+
+    Producers call :meth:`enqueue` and return immediately. The consumer sends up to
+    ``rate_limit`` queued messages concurrently, then waits out the rest of the second,
+    so delivery runs at Telegram's broadcast ceiling without blocking the producers.
+    """
+
+    def __init__(self, rate_limit: int = 30):
+        self._rate_limit = rate_limit
+        self._queue: asyncio.Queue[tuple[int, str]] = asyncio.Queue()
+        self._notif: NotificationService | None = None
+        self._task: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self, notif: NotificationService) -> None:
+        """Start the consumer task sending through *notif*."""
+        if self.running:
+            return
+        self._notif = notif
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the consumer; messages still queued are dropped with a warning."""
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        if not self._queue.empty():
+            logger.warning("Notification queue stopped with %d unsent messages", self._queue.qsize())
+
+    def enqueue(self, chat_id: int, text: str) -> None:
+        """Queue a message for background delivery."""
+        self._queue.put_nowait((chat_id, text))
+
+    async def join(self) -> None:
+        """Wait until every queued message has been handled."""
+        await self._queue.join()
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self._rate_limit and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            started = loop.time()
+            results = await asyncio.gather(
+                *(self._notif.send_message(chat_id, text) for chat_id, text in batch),
+                return_exceptions=True,
+            )
+            for (chat_id, _), result in zip(batch, results):
+                if isinstance(result, Exception):
+                    logger.error("Failed to send queued notification to %s: %s", chat_id, result)
+                self._queue.task_done()
+            # At most one batch per second keeps delivery under the rate limit
+            await asyncio.sleep(max(0.0, 1.0 - (loop.time() - started)))
+
+
+notification_queue = NotificationQueue()
@@ -19,6 +19,10 @@ import aiosqlite
 DATABASE_PATH = os.getenv("DATABASE_PATH", "bot.db")
 POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
 POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))  # seconds
+# Optional PRAGMA synchronous level for pool connections; the test suite uses OFF
+# since its throwaway databases need no durability. Unset keeps SQLite's default.
+DB_SYNCHRONOUS = os.getenv("DB_SYNCHRONOUS", "").upper()
+_SYNCHRONOUS_LEVELS = {"OFF", "NORMAL", "FULL", "EXTRA"}
 CURRENT_SCHEMA_VERSION = 1
 
 
@@ -139,6 +143,24 @@ async def _initialize_database() -> None:
         raise
 
 
+async def _open_connection() -> aiosqlite.Connection:
+    """Open a pool connection with row access by name and foreign keys enforced.
+
+    A PRAGMA runs outside any transaction, so no commit (and no extra trip
+    through the aiosqlite worker thread) is needed after it.
+    """
+    conn = await aiosqlite.connect(
+        DATABASE_PATH,
+        timeout=POOL_TIMEOUT,
+        cached_statements=128,
+    )
+    conn.row_factory = aiosqlite.Row
+    await conn.execute("PRAGMA foreign_keys = ON;")
+    if DB_SYNCHRONOUS in _SYNCHRONOUS_LEVELS:
+        await conn.execute(f"PRAGMA synchronous = {DB_SYNCHRONOUS};")
+    return conn
+
+
 async def _initialize_pool() -> None:
     """Create and populate the connection pool."""
     global _pool, _pool_initialized
@@ -152,13 +174,7 @@ async def _initialize_pool() -> None:
     # verbose) `file:memdb?mode=memory&cache=shared` URI in every test.
     if DATABASE_PATH == ":memory:":
         # Lazily create the schema on the very first (and only) connection
-        conn = await aiosqlite.connect(
-            DATABASE_PATH,
-            timeout=POOL_TIMEOUT,
-            cached_statements=128,
-        )
-        conn.row_factory = aiosqlite.Row
-        await conn.execute("PRAGMA foreign_keys = ON;")
+        conn = await _open_connection()
         # Ensure the schema exists on this shared connection.
         if SCHEMA_FILE.exists():
             schema_sql = SCHEMA_FILE.read_text(encoding="utf-8")
@@ -183,14 +199,7 @@ async def _initialize_pool() -> None:
     q: asyncio.Queue[aiosqlite.Connection] = asyncio.Queue(maxsize=POOL_SIZE)
     for i in range(POOL_SIZE):
         try:
-            conn = await aiosqlite.connect(
-                DATABASE_PATH,
-                timeout=POOL_TIMEOUT,
-                cached_statements=128,
-            )
-            conn.row_factory = aiosqlite.Row
-            await conn.execute("PRAGMA foreign_keys = ON;")
-            await conn.commit()
+            conn = await _open_connection()
             await q.put(conn)
             logger.debug("Opened connection %d/%d", i + 1, POOL_SIZE)
         except Exception as e:
@@ -236,15 +245,7 @@ async def get_connection() -> AsyncIterator[aiosqlite.Connection]:
             "Database connection is invalid, recreating new connection: %s", e
         )
         try:
-            new_conn = await aiosqlite.connect(
-                DATABASE_PATH,
-                timeout=POOL_TIMEOUT,
-                cached_statements=128,
-            )
-            new_conn.row_factory = aiosqlite.Row
-            await new_conn.execute("PRAGMA foreign_keys = ON;")
-            await new_conn.commit()
-            conn = new_conn
+            conn = await _open_connection()
         except Exception as ex:
             logger.error("Failed to recreate database connection: %s", ex)
 
@@ -292,3 +293,76 @@ async def close_pool() -> None:
     _pool = None
     _pool_initialized = False
     logger.info("Database connection pool closed")
+
+
+class ReadOnlyPool:
+    """
+    Fixed-size pool of read-only connections to a database file.
+
+    With WAL journaling readers see a consistent snapshot and never block the writer,
+    so read-only jobs can run their queries in parallel with a writing connection.
+    Connections are opened lazily on first acquire.
+
+    Usage:
+        pool = ReadOnlyPool(path, size=4)
+        async with pool.acquire() as conn:
+            cursor = await conn.execute(...)
+        await pool.close()
+    """
+
+    def __init__(self, path: str, size: int = 4):
+        self._path = path
+        self._size = size
+        self._queue: asyncio.Queue[aiosqlite.Connection] | None = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    async def _open(self) -> aiosqlite.Connection:
+        conn = await aiosqlite.connect(
+            f"file:{self._path}?mode=ro",
+            uri=True,
+            timeout=POOL_TIMEOUT,
+            cached_statements=128,
+        )
+        conn.row_factory = aiosqlite.Row
+        await conn.execute("PRAGMA temp_store = MEMORY;")
+        return conn
+
+    async def _fill(self) -> asyncio.Queue[aiosqlite.Connection]:
+        async with self._lock:
+            if self._queue is None:
+                q: asyncio.Queue[aiosqlite.Connection] = asyncio.Queue(maxsize=self._size)
+                for _ in range(self._size):
+                    await q.put(await self._open())
+                self._queue = q
+                logger.info("Read-only connection pool for %s initialized with size %d", self._path, self._size)
+        return self._queue
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Borrow a read-only connection for the duration of the block."""
+        q = self._queue or await self._fill()
+        try:
+            conn = await asyncio.wait_for(q.get(), timeout=POOL_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.error("Timed out waiting for read-only database connection")
+            raise RuntimeError("Database connection timeout")
+        try:
+            yield conn
+        finally:
+            q.put_nowait(conn)
+
+    async def close(self) -> None:
+        """Close every pooled connection."""
+        q, self._queue = self._queue, None
+        if q is None:
+            return
+        while not q.empty():
+            conn = q.get_nowait()
+            try:
+                await conn.close()
+            except Exception as exc:  # pragma: no cover - cleanup best effort
+                logger.warning("Error closing read-only DB connection: %s", exc)
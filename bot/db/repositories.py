@@ -4,12 +4,15 @@
 
 from __future__ import annotations
 
+import json
 import logging
 import inspect
-from typing import List, Optional
+import random
+from typing import Dict, Iterable, List, Optional, Tuple
 import aiosqlite
 
 from . import connection
+from ..utils.cache import TTLCache
 import inspect
 
 
@@ -36,10 +39,23 @@ from .models import (
 
 logger = logging.getLogger(__name__)
 
+# Short-lived cache for get_by_id: every update looks its sender up, and user rows
+# rarely change within a minute. Writes through this repository evict the entry.
+USER_CACHE_TTL = 60  # seconds
+_user_cache = TTLCache(maxsize=10_000, ttl=USER_CACHE_TTL)
+
+# Users added by username get a random negative id until they register with their Telegram id
+_MIN_PLACEHOLDER_ID = -(2**63) + 1
+
 
 class UserRepository:
     """SQLite implementation of user repository."""
 
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop every cached get_by_id result, e.g. after the users table was changed behind the repository."""
+        _user_cache.clear()
+
     @classmethod
     async def add(cls, username: str) -> UserModel:
         """
@@ -49,10 +65,7 @@ class UserRepository:
         try:
             ctx = await _acquire_connection()
             async with ctx as conn:
-                import random
-
-                min_sql_int = -9223372036854775808
-                user_id = random.randint(min_sql_int + 1, -1)
+                user_id = random.randint(_MIN_PLACEHOLDER_ID, -1)
                 await conn.execute(
                     """
                     INSERT INTO users (user_id, username, first_name)
@@ -74,6 +87,9 @@ class UserRepository:
     @classmethod
     async def get_by_id(cls, user_id: int) -> Optional[UserModel]:
         """Retrieve a user by their ID."""
+        cached = _user_cache.get(user_id)
+        if cached is not None:
+            return cached.model_copy()
         try:
             ctx = await _acquire_connection()
             async with ctx as conn:
@@ -83,7 +99,9 @@ class UserRepository:
                 )
                 row = await cursor.fetchone()
                 if row:
-                    return UserModel(**dict(row))  # type: ignore
+                    user = UserModel(**dict(row))  # type: ignore
+                    _user_cache[user_id] = user.model_copy()
+                    return user
                 return None
         except Exception as e:
             logger.exception("Failed to get user by id %d: %s", user_id, e)
@@ -107,6 +125,46 @@ class UserRepository:
             logger.exception("Failed to get user by username %s: %s", username, e)
             raise
 
+    @classmethod
+    async def get_by_usernames(cls, usernames: Iterable[str]) -> Dict[str, UserModel]:
+        """Retrieve several users in one query, keyed by lower-cased username."""
+        names = list(dict.fromkeys(name.lower() for name in usernames))
+        if not names:
+            return {}
+        try:
+            ctx = await _acquire_connection()
+            async with ctx as conn:
+                cursor = await conn.execute(
+                    "SELECT * FROM users WHERE LOWER(username) IN (SELECT value FROM json_each(?))",
+                    (json.dumps(names),),
+                )
+                rows = await cursor.fetchall()
+        except Exception as e:
+            logger.exception("Failed to get users by usernames %s: %s", names, e)
+            raise
+        users = [UserModel(**dict(row)) for row in rows]  # type: ignore
+        return {user.username.lower(): user for user in users if user.username}
+
+    @classmethod
+    async def get_by_ids(cls, user_ids: Iterable[int]) -> Dict[int, UserModel]:
+        """Retrieve several users in one query, keyed by user ID."""
+        ids = list(dict.fromkeys(user_ids))
+        if not ids:
+            return {}
+        try:
+            ctx = await _acquire_connection()
+            async with ctx as conn:
+                cursor = await conn.execute(
+                    "SELECT * FROM users WHERE user_id IN (SELECT value FROM json_each(?))",
+                    (json.dumps(ids),),
+                )
+                rows = await cursor.fetchall()
+        except Exception as e:
+            logger.exception("Failed to get users by ids %s: %s", ids, e)
+            raise
+        users = [UserModel(**dict(row)) for row in rows]  # type: ignore
+        return {user.user_id: user for user in users}
+
     @classmethod
     async def get_or_create_user(
         cls,
@@ -149,6 +207,7 @@ class UserRepository:
                 existing = await cursor.fetchone()
                 if existing:
                     old_id = existing[0]
+                    _user_cache.pop(old_id)
                     # Merge into new user_id
                     await conn.execute(
                         """
@@ -214,6 +273,7 @@ class UserRepository:
                     (language_code, user_id),
                 )
                 await conn.commit()
+                _user_cache.pop(user_id)
         except Exception as e:
             logger.exception("Failed to update language for user %d: %s", user_id, e)
             raise
@@ -229,6 +289,7 @@ class UserRepository:
                     (contact, user_id),
                 )
                 await conn.commit()
+                _user_cache.pop(user_id)
         except Exception as e:
             logger.exception("Failed to update contact for user %d: %s", user_id, e)
             raise
@@ -244,6 +305,7 @@ class UserRepository:
                     (payday_days, user_id),
                 )
                 await conn.commit()
+                _user_cache.pop(user_id)
         except Exception as e:
             logger.exception("Failed to update reminders for user %d: %s", user_id, e)
             raise
@@ -282,6 +344,93 @@ class UserRepository:
             )
             raise
 
+    @classmethod
+    async def add_trusts_bulk(cls, user_id: int, usernames: List[str]) -> Tuple[List[str], List[str]]:
+        """
+        Trust several users at once inside a single transaction.
+
+        Returns ``(added, not_found)``: the usernames that were newly trusted and
+        those with no registered user. Already trusted usernames are in neither list.
+        """
+        names = list(dict.fromkeys(name.lower() for name in usernames))
+        if not names:
+            return [], []
+
+        conn_ctx = await _acquire_connection()
+        async with conn_ctx as conn:
+            await conn.execute("BEGIN")
+            try:
+                cursor = await conn.execute(
+                    """
+                    SELECT user_id, LOWER(username) AS username,
+                           user_id IN (
+                               SELECT trusted_user_id FROM trusted_users WHERE user_id = ?
+                           ) AS trusted
+                    FROM users
+                    WHERE LOWER(username) IN (SELECT value FROM json_each(?))
+                    """,
+                    (user_id, json.dumps(names)),
+                )
+                rows = await cursor.fetchall()
+                new_rows = [row for row in rows if not row["trusted"]]
+                await conn.executemany(
+                    """
+                    INSERT OR IGNORE INTO trusted_users (user_id, trusted_user_id)
+                    VALUES (?, ?)
+                    """,
+                    [(user_id, row["user_id"]) for row in new_rows],
+                )
+                await conn.commit()
+            except Exception as e:
+                logger.exception("Failed to bulk add trusts for user %d: %s", user_id, e)
+                await conn.rollback()
+                raise
+
+        found = {row["username"] for row in rows}
+        added = {row["username"] for row in new_rows}
+        return [name for name in names if name in added], [name for name in names if name not in found]
+
+    @classmethod
+    async def remove_trusts_bulk(cls, user_id: int, usernames: List[str]) -> List[str]:
+        """
+        Remove several trust relationships inside a single transaction.
+
+        Returns the usernames that were removed. Usernames that are not in the
+        trusted list are skipped.
+        """
+        names = list(dict.fromkeys(name.lower() for name in usernames))
+        if not names:
+            return []
+
+        conn_ctx = await _acquire_connection()
+        async with conn_ctx as conn:
+            await conn.execute("BEGIN")
+            try:
+                cursor = await conn.execute(
+                    """
+                    SELECT u.user_id, LOWER(u.username) AS username FROM trusted_users tu
+                    JOIN users u ON tu.trusted_user_id = u.user_id
+                    WHERE tu.user_id = ? AND LOWER(u.username) IN (SELECT value FROM json_each(?))
+                    """,
+                    (user_id, json.dumps(names)),
+                )
+                rows = await cursor.fetchall()
+                await conn.executemany(
+                    """
+                    DELETE FROM trusted_users
+                    WHERE user_id = ? AND trusted_user_id = ?
+                    """,
+                    [(user_id, row["user_id"]) for row in rows],
+                )
+                await conn.commit()
+            except Exception as e:
+                logger.exception("Failed to bulk remove trusts for user %d: %s", user_id, e)
+                await conn.rollback()
+                raise
+
+        removed = {row["username"] for row in rows}
+        return [name for name in names if name in removed]
+
     @classmethod
     async def trusts(cls, user_id: int, other_username: str) -> bool:
         """
@@ -13,6 +13,7 @@ from aiogram.types import (
 from ..db.repositories import UserRepository
 from ..db.models import User as UserModel
 from ..locales import LOCALES_DIR
+from ..locales.main import remember_user_language
 
 language_router = Router(name="language")
 
@@ -119,7 +120,8 @@ async def language_selection_handler(
             
             await callback.answer(success_alert, show_alert=False)
             
-            await state.update_data(user_language=lang_code)
+            await state.update_data(user_language=lang_code, language=lang_code)
+            await remember_user_language(db_user.user_id, lang_code)
             
         except Exception as e:
             error_text = "❌ Failed to update language" if lang_code == "en" else "❌ Не удалось обновить язык"
@@ -1,19 +1,21 @@
+import asyncio
+import re
 from typing import Callable
 from aiogram import F, Router
 from aiogram.filters import Command
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
-from aiogram.types import (
-    CallbackQuery,
-    InlineKeyboardButton,
-    InlineKeyboardMarkup,
-    Message,
-)
+from aiogram.types import CallbackQuery, Message
 
 from ..db.repositories import UserRepository
 from ..db.models import User as UserModel
 
-from bot.keyboards.profile_kbs import get_settings_menu_kb, back_to_settings_kb
+from bot.keyboards.profile_kbs import (
+    get_settings_menu_kb,
+    back_to_settings_kb,
+    trusted_menu_kb,
+    trusted_cancel_kb,
+)
 from bot.locales.main import get_user_language, get_localization
 from bot.utils.validators import (
     validate_username,
@@ -24,6 +26,11 @@ from bot.utils.validators import (
 user_repo = UserRepository()
 profile_router = Router(name="profile")
 
+# Comma-separated days of month (1-31); blank input clears the reminders
+_DAY = r"0?(?:[1-9]|[12]\d|3[01])"
+DAYS_RE = re.compile(rf"\s*(?:{_DAY}\s*(?:,\s*{_DAY}\s*)*)?")
+DAY_TOKEN_RE = re.compile(r"\d+")
+
 
 class ProfileSettings(StatesGroup):
     """FSM States for profile settings."""
@@ -34,30 +41,46 @@ class ProfileSettings(StatesGroup):
     trusted_users = State()
 
 
+async def reset_state(state: FSMContext, new_state: State) -> None:
+    """Switch to *new_state* with empty data.
+
+    Equivalent to ``state.clear()`` followed by ``state.set_state()`` but
+    saves the extra storage write of the intermediate ``None`` state.
+    """
+    await state.set_state(new_state)
+    await state.set_data({})
+
+
 @profile_router.message(Command("settings"))
 async def settings_handler(message: Message, state: FSMContext):
     if message.from_user is None:
         return
 
     user_lang = await get_user_language(message.from_user.id, state)
-    # Clear any existing FSM state and set to main
-    await state.clear()
-    await state.set_state(ProfileSettings.main)
+    await _render_settings(message, user_lang, state)
+
+
+async def _render_settings(message: Message, user_lang: str, state: FSMContext) -> None:
+    """Show the settings menu for an already resolved language."""
+    loc = get_localization(user_lang)
+    # Drop any existing FSM data and switch to main
+    await reset_state(state, ProfileSettings.main)
 
     await message.answer(
-        text=str(get_localization(user_lang).SETTINGS),
-        reply_markup=get_settings_menu_kb(user_lang),
+        text=str(loc.SETTINGS),
+        reply_markup=get_settings_menu_kb(loc),
     )
 
 
 @profile_router.callback_query(F.data == "set_contact")
 async def set_contact_handler(callback: CallbackQuery, state: FSMContext):
     user_lang = await get_user_language(callback.from_user.id, state)
+    loc = get_localization(user_lang)
     message = callback.message
     if isinstance(message, Message):
         await message.edit_text(
-            text=str(get_localization(user_lang).profile_contact_prompt),
-            reply_markup=back_to_settings_kb(user_lang),
+            text=str(loc.profile_contact_prompt),
+            reply_markup=back_to_settings_kb(loc),
         )
     await state.set_state(ProfileSettings.contact_info)
 
@@ -73,26 +96,27 @@ async def handle_contact_info_input(
         return
 
     user_lang = await get_user_language(message.from_user.id, state)
+    loc = get_localization(user_lang)
     text = message.text or ""
 
     if not text.strip() or not is_valid_contact_info(text):
-        await message.reply(str(get_localization(user_lang).profile_contact_invalid))
+        await message.reply(str(loc.profile_contact_invalid))
         return
 
     await user_repo.update_user_contact(db_user.user_id, text)
-    await message.answer(str(get_localization(user_lang).profile_contact_saved))
-    await state.clear()
-    await settings_handler(message, state)
+    await message.answer(str(loc.profile_contact_saved))
+    await _render_settings(message, user_lang, state)
 
 
 @profile_router.callback_query(F.data == "set_reminders")
 async def set_reminders_handler(callback: CallbackQuery, state: FSMContext):
     user_lang = await get_user_language(callback.from_user.id, state)
+    loc = get_localization(user_lang)
     message = callback.message
     if isinstance(message, Message):
         await message.edit_text(
-            text=str(get_localization(user_lang).reminder_settings_prompt),
-            reply_markup=back_to_settings_kb(user_lang),
+            text=str(loc.reminder_settings_prompt),
+            reply_markup=back_to_settings_kb(loc),
         )
 
     await state.set_state(ProfileSettings.reminders)
@@ -110,60 +134,25 @@ async def handle_reminders_input(
         return
 
     user_lang = await get_user_language(message.from_user.id, state)
+    loc = get_localization(user_lang)
     text = message.text or ""
-    parts = [p.strip() for p in text.split(",") if p.strip()]
-    days = []
-    for part in parts:
-        if not part.isdigit():
-            await message.reply(str(get_localization(user_lang).reminder_invalid_day))
-            return
-        num = int(part)
-        if num < 1 or num > 31:
-            await message.reply(str(get_localization(user_lang).reminder_invalid_day))
-            return
-        days.append(str(num))
-    # Save reminder settings as comma-separated string
-    days_str = ",".join(days)
+    if not DAYS_RE.fullmatch(text):
+        await message.reply(str(loc.reminder_invalid_day))
+        return
+    # Save reminder settings as a sorted, de-duplicated comma-separated string
+    days = sorted({int(day) for day in DAY_TOKEN_RE.findall(text)})
+    days_str = ",".join(map(str, days))
     await user_repo.update_user_reminders(db_user.user_id, days_str)
     # Acknowledge
-    await message.answer(str(get_localization(user_lang).reminder_settings_saved))
-
-    await state.clear()
-    await settings_handler(message, state)
+    await message.answer(str(loc.reminder_settings_saved))
+    await _render_settings(message, user_lang, state)
 
 
 @profile_router.callback_query(F.data == "manage_trusted")
 async def manage_trusted_handler(callback: CallbackQuery, state: FSMContext):
     user_lang = await get_user_language(callback.from_user.id, state)
     loc = get_localization(user_lang)
-    kb = InlineKeyboardMarkup(
-        inline_keyboard=[
-            [
-                InlineKeyboardButton(
-                    text=str(loc.TRUSTED_USER_ADD_PROMPT),
-                    callback_data="trusted_add",
-                )
-            ],
-            [
-                InlineKeyboardButton(
-                    text=str(loc.TRUSTED_USER_REMOVE_PROMPT),
-                    callback_data="trusted_remove",
-                )
-            ],
-            [
-                InlineKeyboardButton(
-                    text=str(loc.TRUSTED_USERS_MENU),
-                    callback_data="trusted_list",
-                )
-            ],
-            [
-                InlineKeyboardButton(
-                    text=str(loc.GENERIC_BACK),
-                    callback_data="back_to_settings",
-                )
-            ],
-        ]
-    )
+    kb = trusted_menu_kb(loc)
     message = callback.message
     if isinstance(message, Message):
         await message.edit_text(text=str(loc.TRUSTED_USERS_MENU), reply_markup=kb)
@@ -175,15 +164,7 @@ async def manage_trusted_handler(callback: CallbackQuery, state: FSMContext):
 async def trusted_add_handler(callback: CallbackQuery, state: FSMContext):
     user_lang = await get_user_language(callback.from_user.id, state)
     loc = get_localization(user_lang)
-    kb = InlineKeyboardMarkup(
-        inline_keyboard=[
-            [
-                InlineKeyboardButton(
-                    text=loc.generic_cancel, callback_data="manage_trusted"
-                )
-            ],
-        ]
-    )
+    kb = trusted_cancel_kb(loc)
     message = callback.message
     if isinstance(message, Message):
         await message.edit_text(text=str(loc.trusted_user_add_prompt), reply_markup=kb)
@@ -195,15 +176,7 @@ async def trusted_add_handler(callback: CallbackQuery, state: FSMContext):
 async def trusted_remove_handler(callback: CallbackQuery, state: FSMContext):
     user_lang = await get_user_language(callback.from_user.id, state)
     loc = get_localization(user_lang)
-    kb = InlineKeyboardMarkup(
-        inline_keyboard=[
-            [
-                InlineKeyboardButton(
-                    text=loc.generic_cancel, callback_data="manage_trusted"
-                )
-            ],
-        ]
-    )
+    kb = trusted_cancel_kb(loc)
     message = callback.message
     if isinstance(message, Message):
         await message.edit_text(
@@ -217,9 +190,11 @@ async def trusted_remove_handler(callback: CallbackQuery, state: FSMContext):
 async def trusted_list_handler(
     callback: CallbackQuery, state: FSMContext, db_user: UserModel
 ):
-    user_lang = await get_user_language(callback.from_user.id, state)
+    user_lang, trusted = await asyncio.gather(
+        get_user_language(callback.from_user.id, state),
+        user_repo.list_trusted(db_user.user_id),
+    )
     loc = get_localization(user_lang)
-    trusted = await user_repo.list_trusted(db_user.user_id)
     if not trusted:
         text = str(loc.trusted_user_list_empty)
     else:
@@ -229,7 +204,7 @@ async def trusted_list_handler(
     if isinstance(message, Message):
         await message.edit_text(
             text=text,
-            reply_markup=back_to_settings_kb(user_lang),
+            reply_markup=back_to_settings_kb(loc),
         )
     await state.clear()
 
@@ -244,20 +219,27 @@ async def handle_trusted_input(
     if message.from_user is None:
         return
 
-    user_lang = await get_user_language(message.from_user.id, state)
+    user_lang, data = await asyncio.gather(
+        get_user_language(message.from_user.id, state), state.get_data()
+    )
     loc = get_localization(user_lang)
-    data = await state.get_data()
     action = data.get("action")
     text = message.text or ""
 
     try:
-        username = validate_username(text.strip())
+        usernames = [validate_username(part.strip()) for part in text.split(",")]
     except ValueError:
         await message.reply(
             loc.error_validation.format(details=loc.trusted_user_add_prompt)
         )
         return
 
+    if len(usernames) > 1 and action in ("add", "remove"):
+        await _handle_trusted_bulk(message, loc, db_user, action, usernames)
+        await state.clear()
+        return
+
+    username = usernames[0]
     if action == "add":
         exists = await user_repo.trusts(db_user.user_id, username)
         if exists:
@@ -283,15 +265,45 @@ async def handle_trusted_input(
     await state.clear()
 
 
+async def _handle_trusted_bulk(
+    message: Message, loc, db_user: UserModel, action: str, usernames: list[str]
+) -> None:
+    """Apply a comma-separated trusted-user edit in one transaction and reply once."""
+    # one line per user, matched case-insensitively like the repository does
+    unique: dict[str, str] = {}
+    for username in usernames:
+        unique.setdefault(username.lower(), username)
+
+    not_found: set[str] = set()
+    if action == "add":
+        added, missing = await user_repo.add_trusts_bulk(db_user.user_id, usernames)
+        changed, not_found = set(added), set(missing)
+        done_template, skipped_template = loc.trusted_user_add_success, loc.trusted_user_add_exists
+    else:
+        changed = set(await user_repo.remove_trusts_bulk(db_user.user_id, usernames))
+        done_template, skipped_template = loc.trusted_user_remove_success, loc.trusted_user_remove_not_found
+
+    lines = []
+    for key, username in unique.items():
+        if key in changed:
+            template = done_template
+        elif key in not_found:
+            template = loc.trusted_user_add_not_found
+        else:
+            template = skipped_template
+        lines.append(template.format(username=username))
+    await message.answer("\n".join(lines))
+
+
 @profile_router.callback_query(F.data == "back_to_settings")
 async def back_to_settings_handler(callback: CallbackQuery, state: FSMContext):
     user_lang = await get_user_language(callback.from_user.id, state)
-    await state.clear()
-    await state.set_state(ProfileSettings.main)
+    loc = get_localization(user_lang)
+    await reset_state(state, ProfileSettings.main)
 
     message = callback.message
     if isinstance(message, Message):
         await message.edit_text(
-            text=get_localization(user_lang).SETTINGS,
-            reply_markup=get_settings_menu_kb(user_lang),
+            text=loc.SETTINGS,
+            reply_markup=get_settings_menu_kb(loc),
         )
@@ -1,8 +1,12 @@
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 from bot.locales.main import Localization
-import json
 from typing import Dict, Any
 
+import orjson
+
+# Button texts and callback data below are produced by us, so buttons and markups are
+# built with ``model_construct`` to skip redundant pydantic validation on every render.
+
 
 def encode_callback_data(action: str, debt_id: int, **kwargs) -> str:
     """Encode callback data for secure button interactions."""
@@ -11,14 +15,14 @@ def encode_callback_data(action: str, debt_id: int, **kwargs) -> str:
         "debt_id": debt_id,
         **kwargs
     }
-    return json.dumps(data, separators=(',', ':'))
+    return orjson.dumps(data).decode()
 
 
 def decode_callback_data(callback_data: str) -> Dict[str, Any]:
     """Decode callback data from button interactions."""
     try:
-        return json.loads(callback_data)
-    except (json.JSONDecodeError, TypeError):
+        return orjson.loads(callback_data)
+    except (orjson.JSONDecodeError, TypeError):
         return {}
 
 
@@ -27,17 +31,17 @@ def get_debt_confirmation_kb(debt_id: int, lang: str) -> InlineKeyboardMarkup:
     loc = Localization(lang)
     buttons = [
         [
-            InlineKeyboardButton(
+            InlineKeyboardButton.model_construct(
                 text=loc.debt_buttons['agree'], 
                 callback_data=encode_callback_data("debt_agree", debt_id)
             ),
-            InlineKeyboardButton(
+            InlineKeyboardButton.model_construct(
                 text=loc.debt_buttons['decline'], 
                 callback_data=encode_callback_data("debt_decline", debt_id)
             )
         ]
     ]
-    return InlineKeyboardMarkup(inline_keyboard=buttons)
+    return InlineKeyboardMarkup.model_construct(inline_keyboard=buttons)
 
 
 def get_payment_confirmation_kb(payment_id: int, debt_id: int, lang: str) -> InlineKeyboardMarkup:
@@ -45,17 +49,17 @@ def get_payment_confirmation_kb(payment_id: int, debt_id: int, lang: str) -> Inl
     loc = Localization(lang)
     buttons = [
         [
-            InlineKeyboardButton(
+            InlineKeyboardButton.model_construct(
                 text=loc.payment_buttons['approve'], 
                 callback_data=encode_callback_data("payment_approve", debt_id, payment_id=payment_id)
             ),
-            InlineKeyboardButton(
+            InlineKeyboardButton.model_construct(
                 text=loc.payment_buttons['reject'], 
                 callback_data=encode_callback_data("payment_reject", debt_id, payment_id=payment_id)
             )
         ]
     ]
-    return InlineKeyboardMarkup(inline_keyboard=buttons)
+    return InlineKeyboardMarkup.model_construct(inline_keyboard=buttons)
 
 
 def get_debt_status_kb(debt_id: int, status: str, lang: str) -> InlineKeyboardMarkup:
@@ -65,7 +69,7 @@ def get_debt_status_kb(debt_id: int, status: str, lang: str) -> InlineKeyboardMa
     
     if status == "pending":
         buttons.append([
-            InlineKeyboardButton(
+            InlineKeyboardButton.model_construct(
                 text=loc.debt_buttons['cancel'], 
                 callback_data=encode_callback_data("debt_cancel", debt_id)
             )
@@ -73,13 +77,13 @@ def get_debt_status_kb(debt_id: int, status: str, lang: str) -> InlineKeyboardMa
     elif status == "active":
         buttons.extend([
             [
-                InlineKeyboardButton(
+                InlineKeyboardButton.model_construct(
                     text=loc.debt_buttons['pay'], 
                     callback_data=encode_callback_data("debt_pay", debt_id)
                 )
             ],
             [
-                InlineKeyboardButton(
+                InlineKeyboardButton.model_construct(
                     text=loc.debt_buttons['details'], 
                     callback_data=encode_callback_data("debt_details", debt_id)
                 )
@@ -87,13 +91,13 @@ def get_debt_status_kb(debt_id: int, status: str, lang: str) -> InlineKeyboardMa
         ])
     elif status == "rejected":
         buttons.append([
-            InlineKeyboardButton(
+            InlineKeyboardButton.model_construct(
                 text=loc.debt_buttons['recreate'], 
                 callback_data=encode_callback_data("debt_recreate", debt_id)
             )
         ])
     
-    return InlineKeyboardMarkup(inline_keyboard=buttons)
+    return InlineKeyboardMarkup.model_construct(inline_keyboard=buttons)
 
 
 def get_payment_status_kb(payment_id: int, debt_id: int, status: str, lang: str) -> InlineKeyboardMarkup:
@@ -103,20 +107,20 @@ def get_payment_status_kb(payment_id: int, debt_id: int, status: str, lang: str)
     
     if status == "pending":
         buttons.append([
-            InlineKeyboardButton(
+            InlineKeyboardButton.model_construct(
                 text=loc.payment_buttons['cancel'], 
                 callback_data=encode_callback_data("payment_cancel", debt_id, payment_id=payment_id)
             )
         ])
     elif status == "confirmed":
         buttons.append([
-            InlineKeyboardButton(
+            InlineKeyboardButton.model_construct(
                 text=loc.payment_buttons['receipt'], 
                 callback_data=encode_callback_data("payment_receipt", debt_id, payment_id=payment_id)
             )
         ])
     
-    return InlineKeyboardMarkup(inline_keyboard=buttons)
+    return InlineKeyboardMarkup.model_construct(inline_keyboard=buttons)
 
 
 def get_debt_list_kb(debts: list, page: int, lang: str, debt_type: str = "all") -> InlineKeyboardMarkup:
@@ -131,7 +135,7 @@ def get_debt_list_kb(debts: list, page: int, lang: str, debt_type: str = "all")
     for debt in debts[start_idx:end_idx]:
         debt_text = f"{debt.amount} {debt.currency} - {debt.description[:20]}..."
         buttons.append([
-            InlineKeyboardButton(
+            InlineKeyboardButton.model_construct(
                 text=debt_text,
                 callback_data=encode_callback_data("debt_select", debt.id)
             )
@@ -141,7 +145,7 @@ def get_debt_list_kb(debts: list, page: int, lang: str, debt_type: str = "all")
     nav_buttons = []
     if page > 0:
         nav_buttons.append(
-            InlineKeyboardButton(
+            InlineKeyboardButton.model_construct(
                 text=loc.navigation_buttons['prev'],
                 callback_data=encode_callback_data("debt_list_page", 0, page=page-1, debt_type=debt_type)
             )
@@ -149,7 +153,7 @@ def get_debt_list_kb(debts: list, page: int, lang: str, debt_type: str = "all")
     
     if end_idx < len(debts):
         nav_buttons.append(
-            InlineKeyboardButton(
+            InlineKeyboardButton.model_construct(
                 text=loc.navigation_buttons['next'],
                 callback_data=encode_callback_data("debt_list_page", 0, page=page+1, debt_type=debt_type)
             )
@@ -162,21 +166,21 @@ def get_debt_list_kb(debts: list, page: int, lang: str, debt_type: str = "all")
     filter_buttons = []
     if debt_type != "active":
         filter_buttons.append(
-            InlineKeyboardButton(
+            InlineKeyboardButton.model_construct(
                 text=loc.debt_filter_buttons['active'],
                 callback_data=encode_callback_data("debt_filter", 0, debt_type="active", page=0)
             )
         )
     if debt_type != "pending":
         filter_buttons.append(
-            InlineKeyboardButton(
+            InlineKeyboardButton.model_construct(
                 text=loc.debt_filter_buttons['pending'],
                 callback_data=encode_callback_data("debt_filter", 0, debt_type="pending", page=0)
             )
         )
     if debt_type != "all":
         filter_buttons.append(
-            InlineKeyboardButton(
+            InlineKeyboardButton.model_construct(
                 text=loc.debt_filter_buttons['all'],
                 callback_data=encode_callback_data("debt_filter", 0, debt_type="all", page=0)
             )
@@ -187,7 +191,7 @@ def get_debt_list_kb(debts: list, page: int, lang: str, debt_type: str = "all")
         for i in range(0, len(filter_buttons), 2):
             buttons.append(filter_buttons[i:i+2])
     
-    return InlineKeyboardMarkup(inline_keyboard=buttons)
+    return InlineKeyboardMarkup.model_construct(inline_keyboard=buttons)
 
 
 def get_debt_actions_kb(debt_id: int, debt_status: str, user_role: str, lang: str) -> InlineKeyboardMarkup:
@@ -198,13 +202,13 @@ def get_debt_actions_kb(debt_id: int, debt_status: str, user_role: str, lang: st
     if user_role == "debtor" and debt_status == "active":
         buttons.extend([
             [
-                InlineKeyboardButton(
+                InlineKeyboardButton.model_construct(
                     text=loc.debt_actions['pay_full'],
                     callback_data=encode_callback_data("debt_pay_full", debt_id)
                 )
             ],
             [
-                InlineKeyboardButton(
+                InlineKeyboardButton.model_construct(
                     text=loc.debt_actions['pay_partial'],
                     callback_data=encode_callback_data("debt_pay_partial", debt_id)
                 )
@@ -212,7 +216,7 @@ def get_debt_actions_kb(debt_id: int, debt_status: str, user_role: str, lang: st
         ])
     elif user_role == "creditor" and debt_status == "active":
         buttons.append([
-            InlineKeyboardButton(
+            InlineKeyboardButton.model_construct(
                 text=loc.debt_actions['remind'],
                 callback_data=encode_callback_data("debt_remind", debt_id)
             )
@@ -221,20 +225,20 @@ def get_debt_actions_kb(debt_id: int, debt_status: str, user_role: str, lang: st
     # Common actions
     buttons.extend([
         [
-            InlineKeyboardButton(
+            InlineKeyboardButton.model_construct(
                 text=loc.debt_actions['view_history'],
                 callback_data=encode_callback_data("debt_history", debt_id)
             )
         ],
         [
-            InlineKeyboardButton(
+            InlineKeyboardButton.model_construct(
                 text=loc.debt_actions['back_to_list'],
                 callback_data=encode_callback_data("debt_back_to_list", debt_id)
             )
         ]
     ])
     
-    return InlineKeyboardMarkup(inline_keyboard=buttons)
+    return InlineKeyboardMarkup.model_construct(inline_keyboard=buttons)
 
 
 def get_processing_kb(lang: str, show_cancel: bool = False) -> InlineKeyboardMarkup:
@@ -244,13 +248,13 @@ def get_processing_kb(lang: str, show_cancel: bool = False) -> InlineKeyboardMar
     
     if show_cancel:
         buttons.append([
-            InlineKeyboardButton(
+            InlineKeyboardButton.model_construct(
                 text=loc.processing_buttons['cancel'],
                 callback_data=encode_callback_data("process_cancel", 0)
             )
         ])
     
-    return InlineKeyboardMarkup(inline_keyboard=buttons)
+    return InlineKeyboardMarkup.model_construct(inline_keyboard=buttons)
 
 
 def get_debt_summary_kb(user_id: int, lang: str) -> InlineKeyboardMarkup:
@@ -258,29 +262,29 @@ def get_debt_summary_kb(user_id: int, lang: str) -> InlineKeyboardMarkup:
     loc = Localization(lang)
     buttons = [
         [
-            InlineKeyboardButton(
+            InlineKeyboardButton.model_construct(
                 text=loc.summary_buttons['view_debts'],
                 callback_data=encode_callback_data("view_debts", 0, user_id=user_id)
             ),
-            InlineKeyboardButton(
+            InlineKeyboardButton.model_construct(
                 text=loc.summary_buttons['view_credits'],
                 callback_data=encode_callback_data("view_credits", 0, user_id=user_id)
             )
         ],
         [
-            InlineKeyboardButton(
+            InlineKeyboardButton.model_construct(
                 text=loc.summary_buttons['create_debt'],
                 callback_data=encode_callback_data("create_debt", 0)
             )
         ],
         [
-            InlineKeyboardButton(
+            InlineKeyboardButton.model_construct(
                 text=loc.summary_buttons['refresh'],
                 callback_data=encode_callback_data("refresh_summary", 0, user_id=user_id)
             )
         ]
     ]
-    return InlineKeyboardMarkup(inline_keyboard=buttons)
+    return InlineKeyboardMarkup.model_construct(inline_keyboard=buttons)
 
 
 def get_mutual_offset_kb(debt_id_1: int, debt_id_2: int, lang: str) -> InlineKeyboardMarkup:
@@ -288,17 +292,17 @@ def get_mutual_offset_kb(debt_id_1: int, debt_id_2: int, lang: str) -> InlineKey
     loc = Localization(lang)
     buttons = [
         [
-            InlineKeyboardButton(
+            InlineKeyboardButton.model_construct(
                 text=loc.offset_buttons['confirm'],
                 callback_data=encode_callback_data("offset_confirm", debt_id_1, debt_id_2=debt_id_2)
             ),
-            InlineKeyboardButton(
+            InlineKeyboardButton.model_construct(
                 text=loc.offset_buttons['cancel'],
                 callback_data=encode_callback_data("offset_cancel", debt_id_1, debt_id_2=debt_id_2)
             )
         ]
     ]
-    return InlineKeyboardMarkup(inline_keyboard=buttons)
+    return InlineKeyboardMarkup.model_construct(inline_keyboard=buttons)
 
 
 def get_back_to_debt_kb(debt_id: int, lang: str) -> InlineKeyboardMarkup:
@@ -306,10 +310,10 @@ def get_back_to_debt_kb(debt_id: int, lang: str) -> InlineKeyboardMarkup:
     loc = Localization(lang)
     buttons = [
         [
-            InlineKeyboardButton(
+            InlineKeyboardButton.model_construct(
                 text=loc.navigation_buttons['back'],
                 callback_data=encode_callback_data("back_to_debt", debt_id)
             )
         ]
     ]
-    return InlineKeyboardMarkup(inline_keyboard=buttons)
+    return InlineKeyboardMarkup.model_construct(inline_keyboard=buttons)
@@ -1,20 +1,43 @@
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 from bot.locales.main import Localization
 
-def get_settings_menu_kb(lang: str) -> InlineKeyboardMarkup:
-    loc = Localization(lang)
+# Static per-language keyboards, built on first use and then served from here
+_TRUSTED_MENU_KBS: dict[str, InlineKeyboardMarkup] = {}
+_TRUSTED_CANCEL_KBS: dict[str, InlineKeyboardMarkup] = {}
+
+def get_settings_menu_kb(loc: Localization) -> InlineKeyboardMarkup:
     sb = loc.settings_buttons or {}
     buttons = [
-        [InlineKeyboardButton(text=sb.get('contact', 'Contact'), callback_data="set_contact")],
-        [InlineKeyboardButton(text=sb.get('reminders', 'Reminders'), callback_data="set_reminders")],
-        [InlineKeyboardButton(text=sb.get('trusted', 'Trusted'), callback_data="manage_trusted")],
+        [InlineKeyboardButton.model_construct(text=sb.get('contact', 'Contact'), callback_data="set_contact")],
+        [InlineKeyboardButton.model_construct(text=sb.get('reminders', 'Reminders'), callback_data="set_reminders")],
+        [InlineKeyboardButton.model_construct(text=sb.get('trusted', 'Trusted'), callback_data="manage_trusted")],
     ]
-    return InlineKeyboardMarkup(inline_keyboard=buttons)
+    return InlineKeyboardMarkup.model_construct(inline_keyboard=buttons)
 
-def back_to_settings_kb(lang: str) -> InlineKeyboardMarkup:
-    loc = Localization(lang)
+def back_to_settings_kb(loc: Localization) -> InlineKeyboardMarkup:
     sb = loc.settings_buttons or {}
     buttons = [
-        [InlineKeyboardButton(text=sb.get('back', 'Back'), callback_data="back_to_settings")]
+        [InlineKeyboardButton.model_construct(text=sb.get('back', 'Back'), callback_data="back_to_settings")]
     ]
-    return InlineKeyboardMarkup(inline_keyboard=buttons) 
+    return InlineKeyboardMarkup.model_construct(inline_keyboard=buttons)
+
+def trusted_menu_kb(loc: Localization) -> InlineKeyboardMarkup:
+    kb = _TRUSTED_MENU_KBS.get(loc.lang_code)
+    if kb is None:
+        rows = (
+            (str(loc.TRUSTED_USER_ADD_PROMPT), "trusted_add"),
+            (str(loc.TRUSTED_USER_REMOVE_PROMPT), "trusted_remove"),
+            (str(loc.TRUSTED_USERS_MENU), "trusted_list"),
+            (str(loc.GENERIC_BACK), "back_to_settings"),
+        )
+        buttons = [[InlineKeyboardButton.model_construct(text=text, callback_data=data)] for text, data in rows]
+        kb = _TRUSTED_MENU_KBS[loc.lang_code] = InlineKeyboardMarkup.model_construct(inline_keyboard=buttons)
+    return kb
+
+def trusted_cancel_kb(loc: Localization) -> InlineKeyboardMarkup:
+    kb = _TRUSTED_CANCEL_KBS.get(loc.lang_code)
+    if kb is None:
+        text = str(loc.generic_cancel)
+        buttons = [[InlineKeyboardButton.model_construct(text=text, callback_data="manage_trusted")]]
+        kb = _TRUSTED_CANCEL_KBS[loc.lang_code] = InlineKeyboardMarkup.model_construct(inline_keyboard=buttons)
+    return kb
@@ -1,10 +1,18 @@
-import json
+import asyncio
+import logging
 from pathlib import Path
+
+import orjson
 from aiogram.fsm.context import FSMContext
 
+logger = logging.getLogger(__name__)
+
 # simple cache for loaded localization files
 _LOCALIZATIONS = {}
 
+# Optional shared store (redis.asyncio.Redis) so every bot instance sees the same language
+_language_store = None
+
 
 class Localization:
     _BUTTON_GROUPS = {
@@ -67,8 +75,7 @@ class Localization:
             self.lang_code = "en"
             p = Path(__file__).parent / "en.json"
 
-        with open(p, "r", encoding="utf-8") as f:
-            _LOCALIZATIONS[self.lang_code] = json.load(f)
+        _LOCALIZATIONS[self.lang_code] = orjson.loads(p.read_bytes())
 
     def __getattr__(self, name):
         if name in self._BUTTON_GROUPS:
@@ -89,6 +96,18 @@ class Localization:
                 return loc_data[key]
         return f"_{name.upper()}_"
 
+    def get(self, key: str, default: str | None = None) -> str | None:
+        """Look up *key* directly in the loaded strings, skipping ``__getattr__`` dispatch.
+
+        The exact key wins; its upper- and lower-case variants are tried next, matching
+        attribute access. Returns *default* when none of them exist.
+        """
+        loc_data = _LOCALIZATIONS.get(self.lang_code, {})
+        value = loc_data.get(key)
+        if value is None:
+            value = loc_data.get(key.upper(), loc_data.get(key.lower(), default))
+        return value
+
     @property
     def settings_buttons(self) -> dict:
         return _LOCALIZATIONS.get(self.lang_code, {}).get("settings_buttons", {})
@@ -98,16 +117,75 @@ def get_localization(lang_code: str) -> Localization:
     return Localization(lang_code)
 
 
+def _load_all_locales() -> list[str]:
+    """Read every locale file not cached yet and return all known language codes."""
+    for path in Path(__file__).parent.glob("*.json"):
+        if path.stem not in _LOCALIZATIONS:
+            _LOCALIZATIONS[path.stem] = orjson.loads(path.read_bytes())
+    return list(_LOCALIZATIONS)
+
+
+async def warmup_locales() -> None:
+    """Preload locale files off the event loop and build the static keyboards.
+
+    Registered as a dispatcher startup hook so the first update in each language
+    does not pay for reading and parsing JSON.
+    """
+    from bot.keyboards.profile_kbs import trusted_cancel_kb, trusted_menu_kb
+
+    lang_codes = await asyncio.to_thread(_load_all_locales)
+    for lang_code in lang_codes:
+        loc = Localization(lang_code)
+        trusted_menu_kb(loc)
+        trusted_cancel_kb(loc)
+    logger.info("Locales warmed up: %s", ", ".join(sorted(lang_codes)))
+
+
+def set_language_store(client) -> None:
+    """Register a Redis client used to share language preferences between bot instances."""
+    global _language_store
+    _language_store = client
+
+
+def _language_key(user_id: int) -> str:
+    return f"u:{user_id}:lang"
+
+
 async def get_user_language(user_id: int, state: FSMContext) -> str:
-    # TODO: Integrate with user repository to get/set user language
+    """Return the user's language from FSM data, then the shared store, falling back to English."""
     data = await state.get_data()
-    return data.get("language", "en")
+    lang = data.get("language")
+    if lang:
+        return lang
+
+    if _language_store is not None:
+        try:
+            cached = await _language_store.get(_language_key(user_id))
+        except Exception as e:
+            logger.warning("Failed to read language for user %d from store: %s", user_id, e)
+            cached = None
+        if cached:
+            lang = cached.decode() if isinstance(cached, bytes) else cached
+            await state.update_data(language=lang)
+            return lang
+
+    return "en"
+
+
+async def remember_user_language(user_id: int, lang_code: str) -> None:
+    """Persist the user's language in the shared store; it is a lasting preference, so it never expires."""
+    if _language_store is None:
+        return
+    try:
+        await _language_store.set(_language_key(user_id), lang_code)
+    except Exception as e:
+        logger.warning("Failed to store language for user %d: %s", user_id, e)
 
 
 def _(key: str, **kwargs) -> str:
     """Translation shortcut for default (English) locale."""
     loc = Localization("en")
-    value = loc.__getattr__(key)
+    value = loc.get(key, f"_{key.upper()}_")
     if kwargs:
         return value.format(**kwargs)
     return value
@@ -1,14 +1,15 @@
-import json
 import logging
-import time
 import asyncio
 from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple
 
+import orjson
 from aiogram import BaseMiddleware
-from aiogram.types import Update, Message, CallbackQuery
+from aiogram.types import Update
 
 from ..db.models import User as UserModel
 from bot.locales import LOCALES_DIR
+from .utils import get_event_user
+from bot.utils.cache import TTLCache
 from ..handlers.language_handlers import (
     detect_user_language_from_telegram,
     get_user_language_preference,
@@ -17,42 +18,104 @@ from ..db.repositories import UserRepository
 
 logger = logging.getLogger(__name__)
 
-# Language preference cache: user_id -> (lang_code, timestamp)
-_lang_cache: Dict[int, Tuple[str, float]] = {}
-_cache_lock = asyncio.Lock()
 CACHE_TTL = 300  # seconds
+CACHE_MAXSIZE = 10_000
 
 
-def get_i18n_instance(domain: str = "bot") -> Callable[[str], Callable[..., str]]:
+# Language preference cache: user_id -> lang_code, bounded and expiring after CACHE_TTL.
+# Accessed only from the event loop, so single-key reads and writes need no lock
+_lang_cache = TTLCache(maxsize=CACHE_MAXSIZE, ttl=CACHE_TTL)
+# In-flight DB language lookups: user_id -> task shared by concurrent cache misses
+_inflight: Dict[int, "asyncio.Task[str]"] = {}
+
+
+async def _load_language_preference(user_id: int) -> str:
+    """Fetch the stored language, letting concurrent misses for one user share a query."""
+    task = _inflight.get(user_id)
+    if task is None:
+        task = asyncio.ensure_future(get_user_language_preference(user_id, UserRepository))
+        _inflight[user_id] = task
+        task.add_done_callback(lambda _: _inflight.pop(user_id, None))
+    # shield: a cancelled caller must not cancel the lookup other callers wait on
+    return await asyncio.shield(task)
+
+
+def _is_start_command(event: Update) -> bool:
+    """Match ``/start`` the way aiogram's Command filter does: exact command, optional @botname."""
+    message = getattr(event, "message", None)
+    text = getattr(message, "text", None)
+    if not isinstance(text, str) or not text.startswith("/start"):
+        return False
+    command = text.split(maxsplit=1)[0]
+    return command.split("@", 1)[0] == "/start"
+
+
+def _read_locale(path) -> Dict[str, Any]:
+    try:
+        return orjson.loads(path.read_bytes())
+    except Exception as e:
+        logger.error("Failed to load locale file %s: %s", path, e)
+        return {}
+
+
+def validate_locales() -> Dict[str, Set[str]]:
     """
-    Creates a simple i18n factory using JSON files.
-    Provides a gettext-like function for localization with coverage validation.
+    Check that every locale file defines the same keys.
+
+    Loads all locales eagerly, so it is meant for tests and CI rather than bot startup.
+    Returns a mapping of language code to its missing keys (only languages with gaps).
     """
-    translations: Dict[str, Dict[str, Any]] = {}
-    for loc in LOCALES_DIR.glob("*.json"):
-        lang = loc.stem
-        try:
-            with open(loc, "r", encoding="utf-8") as f:
-                translations[lang] = json.load(f)
-        except Exception as e:
-            logger.error("Failed to load locale file %s: %s", loc, e)
-
-    # Coverage validation: ensure all languages have the same keys
+    translations = {loc.stem: _read_locale(loc) for loc in LOCALES_DIR.glob("*.json")}
     all_keys: Set[str] = set()
     for lang_data in translations.values():
-        all_keys.update(lang_data.keys())
+        all_keys.update(lang_data)
+    missing: Dict[str, Set[str]] = {}
     for lang, lang_data in translations.items():
-        missing_keys = all_keys - set(lang_data.keys())
+        missing_keys = all_keys.difference(lang_data)
         if missing_keys:
             logger.warning("Missing translation keys for '%s': %s", lang, missing_keys)
+            missing[lang] = missing_keys
+    return missing
+
+
+def get_i18n_instance(domain: str = "bot") -> Callable[[str], Callable[..., str]]:
+    """
+    Creates a simple i18n factory using JSON files.
+    Provides a gettext-like function for localization. Only the default ("ru")
+    locale is read up front; other languages are loaded on first use.
+    """
+    locale_paths = {loc.stem: loc for loc in LOCALES_DIR.glob("*.json")}
+    translations: Dict[str, Dict[str, Any]] = {}
+
+    def load(lang: str) -> Optional[Dict[str, Any]]:
+        lang_data = translations.get(lang)
+        if lang_data is None and lang in locale_paths:
+            lang_data = translations[lang] = _read_locale(locale_paths[lang])
+        return lang_data
+
+    load("ru")
 
     # Track runtime missing keys to avoid log spamming
     runtime_missing: Set[Tuple[str, str]] = set()
+    # One gettext closure per language, reused across updates
+    func_cache: Dict[str, Callable[..., str]] = {}
 
     def gettext_func(lang: str) -> Callable[..., str]:
-        lang_data = translations.get(lang, translations.get("ru", {}))
+        cached = func_cache.get(lang)
+        if cached is None:
+            cached = func_cache[lang] = _build(lang)
+        return cached
+
+    def _build(lang: str) -> Callable[..., str]:
+        lang_data = load(lang)
+        if lang_data is None:
+            lang_data = translations.get("ru", {})
+        # Templates without placeholders can be returned as-is when no kwargs are passed
+        plain_keys = {key for key, value in lang_data.items() if isinstance(value, str) and "{" not in value}
 
         def _(text_key: str, **kwargs) -> str:
+            if not kwargs and text_key in plain_keys:
+                return lang_data[text_key]
             template = lang_data.get(text_key)
             if template is None:
                 if (lang, text_key) not in runtime_missing:
@@ -78,6 +141,8 @@ def get_i18n_instance(domain: str = "bot") -> Callable[[str], Callable[..., str]
 
 
 i18n_factory = get_i18n_instance()
+# Shared translator for updates that carry no user (channel posts, service updates)
+_default_gettext = i18n_factory("ru")
 
 
 class I18nMiddleware(BaseMiddleware):
@@ -91,59 +156,42 @@ class I18nMiddleware(BaseMiddleware):
         event: Update,
         data: Dict[str, Any],
     ) -> Any:
-        # allow instance-level patching by delegating to overridden callable if present
-        override = self.__dict__.get("__call__")
-        if override is not None and override is not I18nMiddleware.__call__:
-            return await override(handler, event, data)
         # Extract user_id and Telegram language_code from the incoming update
-        user_id: Optional[int] = None
-        telegram_lang: Optional[str] = None
-
-        if (
-            hasattr(event, "message")
-            and isinstance(event.message, Message)
-            and event.message.from_user
-        ):
-            user_id = event.message.from_user.id
-            telegram_lang = event.message.from_user.language_code
-        elif (
-            hasattr(event, "callback_query")
-            and isinstance(event.callback_query, CallbackQuery)
-            and event.callback_query.from_user
-        ):
-            user_id = event.callback_query.from_user.id
-            telegram_lang = event.callback_query.from_user.language_code
-
-        # Automatic language detection from Telegram settings
-        if user_id and telegram_lang:
+        user = get_event_user(event, data)
+        if user is None:
+            data["_"] = _default_gettext
+            data["lang_code"] = "ru"
+            return await handler(event, data)
+        user_id: Optional[int] = user.id
+        telegram_lang: Optional[str] = user.language_code
+
+        # Sync the language from Telegram settings only when the user (re)starts the bot
+        if user_id and telegram_lang and _is_start_command(event):
             try:
                 new_lang = await detect_user_language_from_telegram(
                     user_id, telegram_lang, UserRepository
                 )
                 if new_lang:
-                    async with _cache_lock:
-                        _lang_cache[user_id] = (new_lang, time.time())
+                    _lang_cache[user_id] = new_lang
                     if data.get("db_user"):
                         data["db_user"].language_code = new_lang
             except Exception as e:
                 logger.error("Error detecting language for user %d: %s", user_id, e)
 
         # Determine language preference (cache -> db_user -> DB fetch -> fallback)
-        now = time.time()
         lang_code: str
 
         if user_id:
-            async with _cache_lock:
-                cache_entry = _lang_cache.get(user_id)
-            if cache_entry and (now - cache_entry[1] < CACHE_TTL):
-                lang_code = cache_entry[0]
+            cached_lang = _lang_cache.get(user_id)
+            if cached_lang:
+                lang_code = cached_lang
             else:
                 db_user: Optional[UserModel] = data.get("db_user")
                 if db_user and db_user.language_code:
                     lang_code = db_user.language_code
                 elif user_id:
                     try:
-                        lang_code = await get_user_language_preference(user_id)
+                        lang_code = await _load_language_preference(user_id)
                     except Exception as e:
                         logger.error(
                             "Failed to get language preference for user %d: %s",
@@ -153,8 +201,7 @@ class I18nMiddleware(BaseMiddleware):
                         lang_code = "ru"
                 else:
                     lang_code = "ru"
-                async with _cache_lock:
-                    _lang_cache[user_id] = (lang_code, now)
+                _lang_cache[user_id] = lang_code
         else:
             lang_code = "ru"
 
@@ -1,5 +1,6 @@
 import logging
-import uuid
+import itertools
+import secrets
 import time
 import contextvars
 from typing import Callable, Dict, Any, Awaitable
@@ -10,6 +11,14 @@ from aiogram.exceptions import TelegramAPIError, TelegramRetryAfter
 
 correlation_id_ctx: contextvars.ContextVar[str] = contextvars.ContextVar("correlation_id", default="")
 
+# Correlation IDs: a random per-process prefix plus a counter, unique without a urandom call per update
+_CID_PREFIX = secrets.token_hex(4)
+_cid_counter = itertools.count(1)
+
+
+def _next_correlation_id() -> str:
+    return f"{_CID_PREFIX}-{next(_cid_counter):x}"
+
 
 class CorrelationIdFilter(logging.Filter):
     """
@@ -34,6 +43,25 @@ def _fmt_ctx(ctx: Dict[str, Any]) -> str:
     return " ".join(f"{k}={v}" for k, v in ctx.items() if v is not None)
 
 
+def _clean_state(s: Any) -> str:
+    raw = str(s)
+    if raw.startswith("<State '") and raw.endswith("'>"):
+        return raw[len("<State '") : -2]
+    return raw
+
+
+def _handler_repr(handler: Any) -> str:
+    # __qualname__ attribute.
+    handler_module = getattr(handler, "__module__", "")
+    handler_name = getattr(handler, "__qualname__", None)
+    if handler_name is None:
+        handler_name = handler.__class__.__name__
+
+    if handler_module == "functools" and handler_name == "partial":
+        return "UNHANDLED"
+    return f"{handler_module}.{handler_name}"
+
+
 class LoggingMiddleware(BaseMiddleware):
     """
     This middleware logs incoming updates with structured logs,
@@ -46,55 +74,48 @@ class LoggingMiddleware(BaseMiddleware):
         event: Update,
         data: Dict[str, Any],
     ) -> Any:
-        cid = str(uuid.uuid4())
+        cid = _next_correlation_id()
         correlation_id_ctx.set(cid)
         data["correlation_id"] = cid
 
         user = data.get("event_from_user")
         user_id = getattr(user, "id", None)
 
+        # Everything below is only needed for the INFO logs, so skip it when they are off
+        info_enabled = logger.isEnabledFor(logging.INFO)
+
         # Extract FSM state if available
         fsm_state = None
         fsm = data.get("state")
-        if fsm:
+        if fsm and info_enabled:
             try:
                 fsm_state = await fsm.get_state()
             except Exception:
                 fsm_state = None
 
-        # Log the incoming update with structured context
-        incoming_ctx = {
-            "correlation_id": cid,
-            "user_id": user_id,
-            "update_type": event.event_type,
-            "update_id": event.update_id,
-            "fsm_state": fsm_state,
-        }
-
-        logger.info(
-            f"Incoming update {_fmt_ctx(incoming_ctx)}",
-            extra=incoming_ctx,
-        )
-
-        def _clean_state(s: Any) -> str:
-            raw = str(s)
-            if raw.startswith("<State '") and raw.endswith("'>"):
-                return raw[len("<State '") : -2]
-            return raw
-
-        prev_state = data.get("previous_state")
-        current_state_hint = data.get("state") or fsm_state
-        if prev_state is not None and current_state_hint is not None and prev_state != current_state_hint:
-            transition_ctx = {
+        if info_enabled:
+            incoming_ctx = {
                 "correlation_id": cid,
                 "user_id": user_id,
+                "update_type": event.event_type,
+                "update_id": event.update_id,
+                "fsm_state": fsm_state,
             }
-            logger.info(
-                f"FSM transition {_clean_state(prev_state)} -> {_clean_state(current_state_hint)} {_fmt_ctx(transition_ctx)}",
-                extra=transition_ctx,
-            )
-
-        start_time = time.monotonic()
+            logger.info("Incoming update %s", _fmt_ctx(incoming_ctx), extra=incoming_ctx)
+
+            prev_state = data.get("previous_state")
+            current_state_hint = data.get("state") or fsm_state
+            if prev_state is not None and current_state_hint is not None and prev_state != current_state_hint:
+                transition_ctx = {"correlation_id": cid, "user_id": user_id}
+                logger.info(
+                    "FSM transition %s -> %s %s",
+                    _clean_state(prev_state),
+                    _clean_state(current_state_hint),
+                    _fmt_ctx(transition_ctx),
+                    extra=transition_ctx,
+                )
+
+        start_ns = time.perf_counter_ns()
         try:
             result = await handler(event, data)
             return result
@@ -147,30 +168,15 @@ class LoggingMiddleware(BaseMiddleware):
 
         finally:
             # Performance metrics and post-processing log
-            elapsed_ms = int((time.monotonic() - start_time) * 1000)
-
-            # __qualname__ attribute.
-            handler_module = getattr(handler, "__module__", "")
-            handler_name = getattr(handler, "__qualname__", None)
-            if handler_name is None:
-                handler_name = handler.__class__.__name__
-
-            if handler_module == "functools" and handler_name == "partial":
-                handler_repr = "UNHANDLED"
-            else:
-                handler_repr = f"{handler_module}.{handler_name}"
-
-            processed_ctx = {
-                "correlation_id": cid,
-                "user_id": user_id,
-                "update_type": event.event_type,
-                "update_id": event.update_id,
-                "fsm_state": fsm_state,
-                "handler": handler_repr,
-                "execution_time_ms": elapsed_ms,
-            }
-
-            logger.info(
-                f"Handler processed {_fmt_ctx(processed_ctx)}",
-                extra=processed_ctx,
-            )
+            if info_enabled:
+                elapsed_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+                processed_ctx = {
+                    "correlation_id": cid,
+                    "user_id": user_id,
+                    "update_type": event.event_type,
+                    "update_id": event.update_id,
+                    "fsm_state": fsm_state,
+                    "handler": _handler_repr(handler),
+                    "execution_time_ms": elapsed_ms,
+                }
+                logger.info("Handler processed %s", _fmt_ctx(processed_ctx), extra=processed_ctx)
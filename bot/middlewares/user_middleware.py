@@ -1,6 +1,7 @@
 import asyncio
 import logging
 import time
+from collections import deque
 from typing import Any, Awaitable, Callable, Dict, List, NamedTuple, Optional
 
 from aiogram import BaseMiddleware
@@ -9,9 +10,13 @@ from aiogram.enums import MessageEntityType
 
 from ..db.repositories import UserRepository
 from ..middlewares.i18n_middleware import i18n_factory
+from .utils import get_event_user
 
 logger = logging.getLogger(__name__)
 
+# Messages sent before the user's language is known use the default locale
+_fallback_gettext = i18n_factory("ru")
+
 
 class PendingNotification(NamedTuple):
     """Represents a pending notification with timestamp for TTL tracking."""
@@ -27,38 +32,37 @@ class ThreadSafeNotificationQueue:
 
     def __init__(self, max_queue_size: int = 50, ttl_seconds: int = 3600):
         self._lock = asyncio.Lock()
-        self._notifications: Dict[str, List[PendingNotification]] = {}
+        self._notifications: Dict[str, deque[PendingNotification]] = {}
         self._max_queue_size = max_queue_size
         self._ttl_seconds = ttl_seconds
+        # Expired entries are swept at most once per tenth of the TTL, not on every insert
+        self._cleanup_interval = ttl_seconds / 10
+        self._last_cleanup = time.monotonic()
 
     async def add_notification(self, username: str, handler: Callable, update: Update, data: Dict[str, Any]) -> bool:
         """Add a notification to the queue with thread safety and size limits."""
         async with self._lock:
-            await self._cleanup_expired()
+            if time.monotonic() - self._last_cleanup >= self._cleanup_interval:
+                await self._cleanup_expired()
 
-            # Check if user queue is at capacity
-            if username in self._notifications and len(self._notifications[username]) >= self._max_queue_size:
+            # A full bucket drops its oldest notification (FIFO) on append
+            bucket = self._notifications.setdefault(username, deque(maxlen=self._max_queue_size))
+            if len(bucket) >= self._max_queue_size:
                 logger.warning(f"Notification queue full for user {username}, dropping oldest notification")
-                # Remove oldest notification (FIFO)
-                self._notifications[username].pop(0)
 
             # Add new notification
-            notification = PendingNotification(handler=handler, update=update, data=data, timestamp=time.time())
-
-            if username not in self._notifications:
-                self._notifications[username] = []
-            self._notifications[username].append(notification)
+            bucket.append(PendingNotification(handler=handler, update=update, data=data, timestamp=time.time()))
             return True
 
     async def get_and_clear_notifications(self, username: str) -> List[PendingNotification]:
         """Get all notifications for a user and clear them atomically."""
         async with self._lock:
-            notifications = self._notifications.pop(username, [])
-            return notifications
+            return list(self._notifications.pop(username, ()))
 
     async def _cleanup_expired(self) -> None:
         """Remove expired notifications based on TTL."""
         current_time = time.time()
+        self._last_cleanup = time.monotonic()
         expired_users = []
 
         for username, notifications in self._notifications.items():
@@ -67,7 +71,7 @@ class ThreadSafeNotificationQueue:
             if not valid_notifications:
                 expired_users.append(username)
             else:
-                self._notifications[username] = valid_notifications
+                self._notifications[username] = deque(valid_notifications, maxlen=self._max_queue_size)
 
         for username in expired_users:
             del self._notifications[username]
@@ -134,7 +138,8 @@ class UserMiddleware(BaseMiddleware):
                 if len(notifications) > max_size:
                     # Remove oldest notifications (FIFO)
                     excess_count = len(notifications) - max_size
-                    cls._notification_queue._notifications[username] = notifications[excess_count:]
+                    for _ in range(excess_count):
+                        notifications.popleft()
                     removed_count += excess_count
 
         if removed_count > 0:
@@ -171,12 +176,10 @@ class UserMiddleware(BaseMiddleware):
         event: Update,
         data: Dict[str, Any],
     ) -> Any:
-        user = None
-        if hasattr(event, "message") and event.message and event.message.from_user:
-            user = event.message.from_user
-        elif hasattr(event, "callback_query") and event.callback_query and event.callback_query.from_user:
-            user = event.callback_query.from_user
-
+        # Registration is only enforced for messages and button presses
+        if not (getattr(event, "message", None) or getattr(event, "callback_query", None)):
+            return await handler(event, data)
+        user = get_event_user(event, data)
         if not user:
             return await handler(event, data)
 
@@ -219,35 +222,32 @@ class UserMiddleware(BaseMiddleware):
             # User not registered yet: enforce /start
             if bot:
 
-                _ = i18n_factory("ru")
+                _ = _fallback_gettext
                 await bot.send_message(user.id, _("user_not_registered_message"))
             return  # Block further handling until registration
 
         if hasattr(event, "message") and event.message and event.message.entities:
             text = event.message.text or ""
+            mention_names: List[str] = []
+            mentioned_users = []
+            # Split @username and text mentions in a single pass over the entities
             for ent in event.message.entities:
-                if ent.type == MessageEntityType.MENTION:
-                    mention = text[ent.offset : ent.offset + ent.length]
-                    ref_username = mention.lstrip("@")
-                    ref_user = await UserRepository.get_by_username(ref_username)
-                    if not ref_user:
-                        if bot:
-                            _ = i18n_factory("ru")
-                            await bot.send_message(
-                                db_user.user_id, _("user_mention_not_registered", username=ref_username)
-                            )
-                        # Notification will be queued by debt handler after debt creation
-                elif ent.type == MessageEntityType.TEXT_MENTION and ent.user:
-                    ref_user_id = ent.user.id
-                    ref_user = await UserRepository.get_by_id(ref_user_id)
-                    if not ref_user:
-                        ref_username = ent.user.username or str(ref_user_id)
-                        if bot:
-                            _ = i18n_factory("ru")
-                            await bot.send_message(
-                                db_user.user_id, _("user_mention_not_registered", username=ref_username)
-                            )
-                        # Notification will be queued by debt handler after debt creation
+                ent_type = ent.type
+                if ent_type == MessageEntityType.MENTION:
+                    mention_names.append(text[ent.offset : ent.offset + ent.length].lstrip("@"))
+                elif ent_type == MessageEntityType.TEXT_MENTION and ent.user:
+                    mentioned_users.append(ent.user)
+            # Resolve every referenced user with at most two queries
+            known_by_name = await UserRepository.get_by_usernames(mention_names) if mention_names else {}
+            known_by_id = await UserRepository.get_by_ids([u.id for u in mentioned_users]) if mentioned_users else {}
+
+            unknown = [name for name in mention_names if name.lower() not in known_by_name]
+            unknown += [u.username or str(u.id) for u in mentioned_users if u.id not in known_by_id]
+            if bot and unknown:
+                _ = _fallback_gettext
+                for ref_username in dict.fromkeys(unknown):
+                    await bot.send_message(db_user.user_id, _("user_mention_not_registered", username=ref_username))
+            # Notification will be queued by debt handler after debt creation
 
         # Pass the active user object to the handler
         data["db_user"] = db_user
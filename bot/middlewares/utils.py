@@ -0,0 +1,25 @@
+"""Helpers shared by the bot middlewares."""
+
+from typing import Any
+
+from aiogram.types import CallbackQuery, Message, Update, User
+
+
+def get_event_user(event: Update, data: dict[str, Any]) -> User | None:
+    """
+    Return the Telegram user behind *event*.
+
+    Inside the dispatcher aiogram's ``UserContextMiddleware`` has already put it in
+    ``data["event_from_user"]``; the update is only inspected when the middleware is
+    called on its own (e.g. from tests).
+    """
+    user = data.get("event_from_user")
+    if user is not None:
+        return user
+    message = getattr(event, "message", None)
+    if isinstance(message, Message) and message.from_user:
+        return message.from_user
+    callback_query = getattr(event, "callback_query", None)
+    if isinstance(callback_query, CallbackQuery) and callback_query.from_user:
+        return callback_query.from_user
+    return None
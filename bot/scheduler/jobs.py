@@ -1,14 +1,144 @@
+import asyncio
+import json
 import logging
 import aiosqlite
 from aiogram import Bot
 
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta, timezone, date
+from typing import AsyncIterator
 
 from ..config import get_settings
+from ..core.notification_queue import notification_queue
 from ..core.notification_service import NotificationService
+from ..db.connection import ReadOnlyPool
+from ..utils.formatters import format_amount
 
 logger = logging.getLogger(__name__)
 
+# Applied to every job connection: WAL journaling with NORMAL sync needs fewer fsyncs per commit,
+# and a 64 MB page cache keeps the debts table in memory during the scans
+JOB_DB_PRAGMAS = """
+PRAGMA journal_mode = WAL;
+PRAGMA synchronous = NORMAL;
+PRAGMA temp_store = MEMORY;
+PRAGMA cache_size = -64000;
+"""
+
+
+# Connection shared by all job runs, so its statement and page caches survive between ticks
+_job_db: aiosqlite.Connection | None = None
+_job_db_path: str | None = None
+# Read-only connections for the reporting jobs, so their scans never wait on the writer
+_read_pool: ReadOnlyPool | None = None
+READ_POOL_SIZE = 4
+
+
+async def get_db(db_path: str) -> aiosqlite.Connection:
+    """
+    Return the long-lived job connection, opening it on first use or when the path changes.
+
+    The connection gets the tuning pragmas applied and returns rows as aiosqlite.Row.
+    A path change replaces only the writer; the read-only pool is closed only when it
+    serves the old path, since a running job may still hold one of its connections.
+    """
+    global _job_db, _job_db_path, _read_pool
+    if _job_db is not None and _job_db_path == db_path:
+        return _job_db
+    db = await aiosqlite.connect(db_path)
+    await db.executescript(JOB_DB_PRAGMAS)
+    if _job_db is not None and _job_db_path == db_path:
+        # another job opened it while we were connecting
+        await db.close()
+        return _job_db
+    db.row_factory = aiosqlite.Row
+    old_db, _job_db, _job_db_path = _job_db, db, db_path
+    if old_db is not None:
+        await _close_quietly(old_db)
+    if _read_pool is not None and _read_pool.path != db_path:
+        pool, _read_pool = _read_pool, None
+        await pool.close()
+    return db
+
+
+async def _close_quietly(db: aiosqlite.Connection) -> None:
+    try:
+        await db.close()
+    except Exception as e:
+        logger.error(f"Failed to close job database connection: {e}")
+
+
+@asynccontextmanager
+async def _read_db(db_path: str) -> AsyncIterator[aiosqlite.Connection]:
+    """Borrow a read-only job connection; in-memory databases fall back to the shared writer."""
+    global _read_pool
+    # the writer switches the file to WAL before any reader attaches
+    writer = await get_db(db_path)
+    if db_path == ":memory:":
+        yield writer
+        return
+    if _read_pool is None:
+        _read_pool = ReadOnlyPool(db_path, size=READ_POOL_SIZE)
+    async with _read_pool.acquire() as db:
+        yield db
+
+
+async def close_db() -> None:
+    """Close the shared job connection and read-only pool, if open."""
+    global _job_db, _job_db_path, _read_pool
+    pool, _read_pool = _read_pool, None
+    if pool is not None:
+        await pool.close()
+    db, _job_db, _job_db_path = _job_db, None, None
+    if db is not None:
+        await _close_quietly(db)
+
+
+# Upper bound on notifications in flight at once, and the spacing between their starts,
+# so overlapping sends still stay under Telegram's ~30 messages per second
+SEND_CONCURRENCY = 20
+SEND_INTERVAL = 1 / 30
+
+
+async def _send_all(notif: NotificationService, messages: list[tuple[int, str]], what: str) -> list[bool]:
+    """
+    Send every (user_id, text) pair concurrently, at most SEND_CONCURRENCY at a time.
+
+    Returns the delivery result for each message in order; failures are logged and reported as False.
+    """
+    semaphore = asyncio.Semaphore(SEND_CONCURRENCY)
+    loop = asyncio.get_running_loop()
+    next_start = loop.time()
+
+    async def _send(user_id: int, text: str) -> bool:
+        nonlocal next_start
+        async with semaphore:
+            now = loop.time()
+            delay = next_start - now
+            next_start = max(now, next_start) + SEND_INTERVAL
+            if delay > 0:
+                await asyncio.sleep(delay)
+            try:
+                return await notif.send_message(user_id, text)
+            except Exception as e:
+                logger.error(f"Failed to send {what} to {user_id}: {e}")
+                return False
+
+    return await asyncio.gather(*(_send(user_id, text) for user_id, text in messages))
+
+
+async def _deliver(notif: NotificationService, messages: list[tuple[int, str]], what: str) -> None:
+    """
+    Hand messages to the background notification queue when the bot runs one,
+    otherwise send them from the job itself.
+    """
+    if notification_queue.running:
+        for user_id, text in messages:
+            notification_queue.enqueue(user_id, text)
+        logger.info(f"Queued {len(messages)} {what} messages")
+        return
+    await _send_all(notif, messages, what)
+
 
 async def send_weekly_reports(bot: Bot | None = None):
     """
@@ -23,37 +153,31 @@ async def send_weekly_reports(bot: Bot | None = None):
     db_path = settings.db.path
     notif = NotificationService(bot)
     try:
-        async with aiosqlite.connect(db_path) as db:
-            db.row_factory = aiosqlite.Row
-            users_cursor = await db.execute("SELECT user_id, username FROM users WHERE reminder_enabled = 1")
+        async with _read_db(db_path) as db:
+            # One aggregated query instead of two SUMs per user; users with nothing owed either
+            # way are filtered out here rather than sent an all-zero summary
+            users_cursor = await db.execute(
+                "SELECT u.user_id, COALESCE(o.total, 0) AS owes_total, COALESCE(c.total, 0) AS owed_total "
+                "FROM users u "
+                "LEFT JOIN (SELECT debtor_id, SUM(amount) AS total FROM debts "
+                "WHERE status = 'active' GROUP BY debtor_id) o ON o.debtor_id = u.user_id "
+                "LEFT JOIN (SELECT creditor_id, SUM(amount) AS total FROM debts "
+                "WHERE status = 'active' GROUP BY creditor_id) c ON c.creditor_id = u.user_id "
+                "WHERE u.reminder_enabled = 1 AND (o.total > 0 OR c.total > 0)"
+            )
             users = await users_cursor.fetchall()
 
-            for user in users:
-                user_id = user["user_id"]
-                try:
-                    owe_cursor = await db.execute(
-                        "SELECT SUM(amount) AS total FROM debts WHERE debtor_id = ? AND status = 'active'",
-                        (user_id,),
-                    )
-                    owe_row = await owe_cursor.fetchone()
-                    owes_total = owe_row["total"] or 0
-
-                    owed_cursor = await db.execute(
-                        "SELECT SUM(amount) AS total FROM debts WHERE creditor_id = ? AND status = 'active'",
-                        (user_id,),
-                    )
-                    owed_row = await owed_cursor.fetchone()
-                    owed_total = owed_row["total"] or 0
-
-                    text = (
-                        f"📊 Weekly Debt Summary 📊\n\n"
-                        f"You owe: {owes_total / 100:.2f}\n"
-                        f"Owed to you: {owed_total / 100:.2f}\n\n"
-                        f"Have a great week!"
-                    )
-                    await notif.send_message(user_id, text)
-                except Exception as e:
-                    logger.error(f"Failed to send weekly report to {user_id}: {e}")
+        reports = [
+            (
+                user["user_id"],
+                f"📊 Weekly Debt Summary 📊\n\n"
+                f"You owe: {format_amount(user['owes_total'])}\n"
+                f"Owed to you: {format_amount(user['owed_total'])}\n\n"
+                f"Have a great week!",
+            )
+            for user in users
+        ]
+        await _deliver(notif, reports, "weekly report")
 
         logger.info("Weekly reports job completed successfully.")
     except Exception as e:
@@ -76,59 +200,62 @@ async def check_confirmation_timeouts(bot: Bot | None = None):
     db_path = settings.db.path
     now_utc = datetime.now(timezone.utc)
     cutoff = now_utc - timedelta(hours=23)
+    notif = NotificationService(bot)
     try:
-        async with aiosqlite.connect(db_path) as db:
-            db.row_factory = aiosqlite.Row
-            # select debts pending before cutoff
-            cursor = await db.execute(
-                (
-                    "SELECT d.debt_id, d.creditor_id, d.debtor_id, uc.username AS creditor_username, "
-                    "ud.username AS debtor_username FROM debts d "
-                    "LEFT JOIN users uc ON uc.user_id = d.creditor_id "
-                    "LEFT JOIN users ud ON ud.user_id = d.debtor_id "
-                    "WHERE d.status = 'pending' AND d.created_at < ?"
-                ),
-                (cutoff.isoformat(),),
-            )
-            expired = await cursor.fetchall()
-
-            notif = NotificationService(bot)
-
-            for row in expired:
-                debt_id = row["debt_id"]
-                creditor_id = row["creditor_id"]
-                debtor_id = row["debtor_id"]
-                debtor_username = row["debtor_username"]
-
-                # update status to rejected
-                try:
-                    await db.execute(
-                        "UPDATE debts SET status = 'rejected', updated_at = ? WHERE debt_id = ?",
-                        (now_utc.isoformat(), debt_id),
-                    )
-                    await db.commit()
-                except Exception as e:
-                    logger.error(f"Failed to update debt {debt_id} status: {e}")
-                    continue
-
-                # notify creditor
-                debtor_display = f"@{debtor_username}" if debtor_username else f"user {debtor_id}"
-                text = (
-                    f"⚠️ Debt from {debtor_display} was not confirmed within 23 hours "
-                    f"and has been automatically rejected."
+        db = await get_db(db_path)
+        # select debts pending before cutoff
+        cursor = await db.execute(
+            (
+                "SELECT d.debt_id, d.creditor_id, d.debtor_id, uc.username AS creditor_username, "
+                "ud.username AS debtor_username FROM debts d "
+                "LEFT JOIN users uc ON uc.user_id = d.creditor_id "
+                "LEFT JOIN users ud ON ud.user_id = d.debtor_id "
+                "WHERE d.status = 'pending' AND d.created_at < ?"
+            ),
+            (cutoff.isoformat(),),
+        )
+        expired = await cursor.fetchall()
+
+        notices: list[tuple[int, str]] = []
+
+        # reject all expired debts in one statement and a single commit; only debts this run
+        # actually moved out of 'pending' are notified, so an overlapping run cannot notify twice
+        if expired:
+            try:
+                cursor = await db.execute(
+                    "UPDATE debts SET status = 'rejected', updated_at = ? "
+                    "WHERE status = 'pending' AND debt_id IN (SELECT value FROM json_each(?)) "
+                    "RETURNING debt_id",
+                    (now_utc.isoformat(), json.dumps([row["debt_id"] for row in expired])),
                 )
-                try:
-                    ok = await notif.send_message(creditor_id, text)
-                    if not ok:
-                        # If notification failed (e.g., user unregistered), process queue
-                        await notif.process_queued_notifications()
-                except Exception as e:
-                    logger.error(f"Failed to notify creditor {creditor_id} for debt {debt_id}: {e}")
-                    # Try to process queued notifications in case of error
-                    try:
-                        await notif.process_queued_notifications()
-                    except Exception as e2:
-                        logger.error(f"Failed to process queued notifications: {e2}")
+                rejected = {row["debt_id"] for row in await cursor.fetchall()}
+                await db.commit()
+                expired = [row for row in expired if row["debt_id"] in rejected]
+            except Exception as e:
+                logger.error(f"Failed to reject {len(expired)} expired debts: {e}")
+                # the job connection is shared across runs; never leave a failed write open on it
+                await db.rollback()
+                expired = []
+
+        for row in expired:
+            creditor_id = row["creditor_id"]
+            debtor_id = row["debtor_id"]
+            debtor_username = row["debtor_username"]
+
+            # notify creditor
+            debtor_display = f"@{debtor_username}" if debtor_username else f"user {debtor_id}"
+            text = (
+                f"⚠️ Debt from {debtor_display} was not confirmed within 23 hours "
+                f"and has been automatically rejected."
+            )
+            notices.append((creditor_id, text))
+
+        if not all(await _send_all(notif, notices, "timeout notice")):
+            # Some creditors were not reached (e.g., user unregistered), process queue
+            try:
+                await notif.process_queued_notifications()
+            except Exception as e:
+                logger.error(f"Failed to process queued notifications: {e}")
 
         logger.info("Confirmation timeout check completed.")
     except Exception as e:
@@ -151,39 +278,26 @@ async def send_payday_reminders(bot: Bot | None = None):
     db_path = settings.db.path
     today_day = date.today().day
     try:
-        async with aiosqlite.connect(db_path) as db:
-            db.row_factory = aiosqlite.Row
-            # fetch users with payday_days configured
+        async with _read_db(db_path) as db:
+            # Let SQLite pick the users whose comma-separated payday_days contains today
+            # (optionally zero-padded), instead of parsing every user's list in Python
             cursor = await db.execute(
-                "SELECT user_id, payday_days FROM users WHERE payday_days IS NOT NULL AND payday_days != ''"
+                "SELECT user_id FROM users "
+                "WHERE ',' || REPLACE(payday_days, ' ', '') || ',' LIKE ? "
+                "OR ',' || REPLACE(payday_days, ' ', '') || ',' LIKE ?",
+                (f"%,{today_day},%", f"%,0{today_day},%"),
             )
             users = await cursor.fetchall()
 
-            notif = NotificationService(bot)
-
-            for user in users:
-                user_id = user["user_id"]
-                raw = user["payday_days"]
-                try:
-                    days = [int(d.strip()) for d in raw.split(",") if d.strip().isdigit()]
-                    # Validate day numbers are in valid range
-                    days = [d for d in days if 1 <= d <= 31]
-                    if not days:
-                        logger.warning(f"No valid days for user {user_id} after filtering")
-                        continue
-                except Exception:
-                    logger.warning(f"Invalid payday_days format for user {user_id}: '{raw}'")
-                    continue
-                if today_day in days:
-                    text = (
-                        "💰 Payday Reminder 💰\n\n"
-                        "Today is one of your configured payday days. "
-                        "Don't forget to review and settle your debts!"
-                    )
-                    try:
-                        await notif.send_message(user_id, text)
-                    except Exception as e:
-                        logger.error(f"Failed to send payday reminder to {user_id}: {e}")
+        notif = NotificationService(bot)
+        text = (
+            "💰 Payday Reminder 💰\n\n"
+            "Today is one of your configured payday days. "
+            "Don't forget to review and settle your debts!"
+        )
+        reminders = [(user["user_id"], text) for user in users]
+
+        await _deliver(notif, reminders, "payday reminder")
 
         logger.info("Payday reminders job completed.")
     except Exception as e:
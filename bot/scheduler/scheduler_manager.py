@@ -1,35 +1,10 @@
 import logging
+from zoneinfo import ZoneInfo
+
 from aiogram import Bot
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
-
-try:
-    from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore  # type: ignore
-except Exception:  # pragma: no cover
-
-    class SQLAlchemyJobStore:  # type: ignore
-        """Lightweight in-memory stub to satisfy SchedulerManager during unit tests."""
-
-        def __init__(self, *args, **kwargs):
-            self.jobs: dict[str, object] = {}
-
-        def add_job(self, job):
-            self.jobs[job.id] = job
-
-        def remove_job(self, job_id):
-            self.jobs.pop(job_id, None)
-
-        def get_due_jobs(self, now):  # noqa: D401
-            return []
-
-        def lookup_job(self, job_id):  # noqa: D401
-            return self.jobs.get(job_id)
-
-        def shutdown(self):
-            self.jobs.clear()
-
-
-from pytz import timezone
+from apscheduler.jobstores.memory import MemoryJobStore
 
 from ..config import get_settings
 from . import jobs
@@ -42,11 +17,12 @@ class SchedulerManager:
 
     def __init__(self):
         settings = get_settings()
-        db_path = settings.db.path.replace(".db", "_scheduler.db")
 
-        jobstores = {"default": SQLAlchemyJobStore(url=f"sqlite:///{db_path}")}
+        # Both triggers are defined in code and re-registered on start, so nothing needs
+        # to persist between runs; an in-memory store avoids SQLAlchemy and a second DB file
+        jobstores = {"default": MemoryJobStore()}
 
-        self._scheduler = AsyncIOScheduler(jobstores=jobstores, timezone=timezone(settings.scheduler.timezone))
+        self._scheduler = AsyncIOScheduler(jobstores=jobstores, timezone=ZoneInfo(settings.scheduler.timezone))
 
     def start(self, bot: Bot | None = None) -> None:
         """Start the scheduler and register jobs.
@@ -60,16 +36,28 @@ class SchedulerManager:
         """
 
         try:
+            # Stable ids with replace_existing keep one entry per job however often
+            # start() runs; max_instances/coalesce prevent overlapping and
+            # backlogged runs from sending duplicate notifications
             self._scheduler.add_job(
                 jobs.check_confirmation_timeouts,
                 "interval",
                 hours=1,
+                id="check_confirmation_timeouts",
+                replace_existing=True,
+                max_instances=1,
+                coalesce=True,
+                misfire_grace_time=300,
             )
             self._scheduler.add_job(
                 jobs.send_weekly_reports,
                 "cron",
                 day_of_week="mon",
                 hour=10,
+                id="send_weekly_reports",
+                replace_existing=True,
+                max_instances=1,
+                coalesce=True,
             )
 
             self._scheduler.start()
@@ -1,5 +1,3 @@
-from decimal import Decimal
-
 from aiogram.utils.markdown import hlink, hbold, hcode
 
 from bot.db.models import User
@@ -8,9 +6,15 @@ __all__ = ["format_amount", "format_user_link", "format_debt_status_emoji", "hli
 
 def format_amount(amount_in_cents: int) -> str:
     """Formats an amount from cents to a human-readable string."""
-    amount = Decimal(amount_in_cents) / 100
-    # Format to 2 decimal places, trimming trailing zeros if it's a whole number
-    return f"{amount:g}"
+    if amount_in_cents < 0:
+        return "-" + format_amount(-amount_in_cents)
+    units, cents = divmod(amount_in_cents, 100)
+    # Whole amounts have no fractional part; otherwise trailing zeros are trimmed (150 -> "1.5")
+    if not cents:
+        return str(units)
+    if cents % 10:
+        return f"{units}.{cents:02d}"
+    return f"{units}.{cents // 10}"
 
 def format_user_link(user: User) -> str:
     """Formats a user's name as a Telegram link."""
@@ -1,19 +1,42 @@
-import ast
-import operator as op
-
-# Supported operators
-operators = {
-    ast.Add: op.add,
-    ast.Sub: op.sub,
-    ast.Mult: op.mul,
-    ast.Div: op.truediv,
-    ast.USub: op.neg,
-}
-
-def safe_eval(expr: str):
+import re
+from fractions import Fraction
+
+# Numbers (``12``, ``1.5``, ``5.``, ``.5``), operators and parentheses
+_TOKEN_RE = re.compile(r"\s*(?:(\d+\.?\d*|\.\d+)|([-+*/()]))")
+
+# Binary operator precedence; "neg" is unary minus and binds tighter than any of them
+_PRECEDENCE = {"+": 1, "-": 1, "*": 2, "/": 2, "neg": 3}
+
+
+def _apply(op: str, values: list) -> bool:
+    """Apply *op* to the operand stack; returns False on division by zero (pushing 0 instead)."""
+    if op == "neg":
+        values.append(-values.pop())
+        return True
+    right = values.pop()
+    left = values.pop()
+    if op == "+":
+        values.append(left + right)
+    elif op == "-":
+        values.append(left - right)
+    elif op == "*":
+        values.append(left * right)
+    elif not right:
+        values.append(right)
+        return False
+    else:
+        values.append(left / right)
+    return True
+
+
+def safe_eval(expr: str) -> Fraction:
     """
     Safely evaluates a string containing a simple mathematical expression.
-    Only numbers and basic arithmetic operations are allowed.
+    Only numbers, ``+ - * /``, unary minus and parentheses are allowed.
+
+    The expression is evaluated with Dijkstra's two-stack (shunting-yard) algorithm
+    directly over the tokens, in ``Fraction`` arithmetic so the result is exact and
+    is only rounded once, by the caller.
 
     Args:
         expr: The string expression to evaluate.
@@ -22,28 +45,59 @@ def safe_eval(expr: str):
         The result of the evaluation.
 
     Raises:
-        ValueError: If the expression is invalid or contains unsupported elements.
+        ValueError: If the expression is invalid, contains unsupported elements or
+            divides by zero (then chained from a ``ZeroDivisionError``).
     """
+    values: list[Fraction] = []
+    ops: list[str] = []
+    # Division by zero is reported only once the whole expression has been checked
+    divisible = True
+    # True when the next token must be an operand (number, "(" or unary minus)
+    expect_operand = True
+    pos = 0
+    end = len(expr.rstrip())
     try:
-        return _eval(ast.parse(expr, mode="eval").body)
-    except (TypeError, SyntaxError, KeyError, ZeroDivisionError) as e:
+        while pos < end:
+            match = _TOKEN_RE.match(expr, pos)
+            if match is None:
+                raise ValueError
+            pos = match.end()
+            number, symbol = match.groups()
+            if number is not None:
+                # like Python, integers other than zero may not have leading zeros
+                if not expect_operand or (number[0] == "0" and number.isdigit() and number.strip("0")):
+                    raise ValueError
+                values.append(Fraction(number))
+                expect_operand = False
+            elif symbol == "(":
+                if not expect_operand:
+                    raise ValueError
+                ops.append(symbol)
+            elif symbol == ")":
+                if expect_operand:
+                    raise ValueError
+                while ops[-1] != "(":
+                    divisible &= _apply(ops.pop(), values)
+                ops.pop()
+            elif expect_operand:
+                if symbol != "-":
+                    raise ValueError
+                ops.append("neg")
+            else:
+                # left-associative: apply everything of equal or higher precedence first
+                while ops and ops[-1] != "(" and _PRECEDENCE[ops[-1]] >= _PRECEDENCE[symbol]:
+                    divisible &= _apply(ops.pop(), values)
+                ops.append(symbol)
+                expect_operand = True
+        if expect_operand:
+            raise ValueError
+        while ops:
+            op = ops.pop()
+            if op == "(":
+                raise ValueError
+            divisible &= _apply(op, values)
+    except (ValueError, IndexError) as e:
         raise ValueError(f"Invalid expression: {expr}") from e
-
-def _eval(node):
-    """Recursively evaluates an AST node."""
-    if isinstance(node, ast.Num):  # <number>
-        return node.n
-    if isinstance(node, ast.BinOp):  # <left> <operator> <right>
-        if type(node.op) not in operators:
-            raise TypeError(f"Unsupported operator: {type(node.op)}")
-        return operators[type(node.op)](_eval(node.left), _eval(node.right))
-    if isinstance(node, ast.UnaryOp):  # <operator> <operand> e.g., -1
-        if type(node.op) not in operators:
-            raise TypeError(f"Unsupported operator: {type(node.op)}")
-        return operators[type(node.op)](_eval(node.operand))
-    
-    # Python 3.8+ uses ast.Constant for numbers
-    if hasattr(ast, "Constant") and isinstance(node, ast.Constant):
-        return node.n
-
-    raise TypeError(f"Unsupported type: {node}") 
\ No newline at end of file
+    if not divisible:
+        raise ValueError(f"Invalid expression: {expr}") from ZeroDivisionError(f"Division by zero: {expr}")
+    return values[0]
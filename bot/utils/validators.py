@@ -5,12 +5,12 @@ from __future__ import annotations
 import re
 from typing import Final
 
-# Regex for a valid Telegram username
-# Must start with @, be 5-32 characters long, and contain only letters, numbers, and underscores.
-USERNAME_RE = re.compile(r"@[A-Za-z0-9_]{5,32}")
-
+# Regex for a valid Telegram username: optional @, then 5-32 letters, numbers, or underscores
 USERNAME_PATTERN: Final[re.Pattern[str]] = re.compile(r"^@?[A-Za-z0-9_]{5,32}$")
 
+# Contact info: at least one non-space character and nothing that looks like an HTML tag
+CONTACT_INFO_PATTERN: Final[re.Pattern[str]] = re.compile(r"\s*[^<>\s][^<>]*")
+
 # Allowed characters in arithmetic expressions for amounts (digits, ops, parens, slash, whitespace)
 EXPR_ALLOWED_PATTERN: Final[re.Pattern[str]] = re.compile(r"^[0-9\s+\-*/()]+$")
 
@@ -23,7 +23,7 @@ def is_valid_username(username: str) -> bool:
     """
     if not isinstance(username, str):
         return False
-    return bool(re.match(r"^@[a-zA-Z0-9_]{5,32}$", username))
+    return username.startswith("@") and USERNAME_PATTERN.match(username) is not None
 
 def validate_amount(amount: float) -> bool:
     """
@@ -49,12 +49,10 @@ def is_valid_contact_info(contact: str) -> bool:
     - Should not be empty
     - Should not contain obvious malicious patterns (very basic check)
     """
-    if not isinstance(contact, str) or not contact.strip():
-        return False
-    # Avoid things that look like HTML tags
-    if "<" in contact or ">" in contact:
+    if not isinstance(contact, str):
         return False
-    return True
+    # Single pass: rejects blank input and anything that looks like an HTML tag
+    return CONTACT_INFO_PATTERN.fullmatch(contact) is not None
 
 def validate_username(value: str) -> str:
     """Validate a Telegram username and return it without the @ prefix."""
@@ -10,10 +10,13 @@ from aiogram.fsm.storage.memory import MemoryStorage
 from bot.config import get_settings
 from bot.db.connection import get_connection, close_pool
 from bot.core.notification_service import NotificationService
+from bot.core.notification_queue import notification_queue
 from bot.middlewares.user_middleware import UserMiddleware
 from bot.middlewares.i18n_middleware import I18nMiddleware
 from bot.middlewares.logging_middleware import LoggingMiddleware
 from bot.scheduler.scheduler_manager import scheduler_manager
+from bot.scheduler.jobs import close_db as close_job_db
+from bot.locales.main import set_language_store, warmup_locales
 from bot.handlers.common import router as common_router
 from bot.handlers.debt_handlers import router as debt_router
 from bot.handlers.payment_handlers import router as payment_router
@@ -39,8 +42,17 @@ async def main():
         token=settings.bot.token,
         default=DefaultBotProperties(parse_mode=ParseMode.HTML),
     )
-    storage = MemoryStorage()
+    if settings.redis.url:
+        from redis.asyncio import Redis
+        from aiogram.fsm.storage.redis import RedisStorage
+
+        redis = Redis.from_url(settings.redis.url)
+        set_language_store(redis)
+        storage = RedisStorage(redis)
+    else:
+        storage = MemoryStorage()
     dp = Dispatcher(storage=storage)
+    dp.startup.register(warmup_locales)
 
     dp.update.outer_middleware(LoggingMiddleware())
     dp.update.outer_middleware(UserMiddleware())
@@ -49,6 +61,9 @@ async def main():
     notifier = NotificationService(bot)
 
     dp["notification_service"] = notifier
+    # Scheduled jobs hand their broadcasts to this queue instead of sending inline
+    notification_queue.start(notifier)
+    dp.shutdown.register(notification_queue.stop)
 
     dp.include_router(common_router)
     dp.include_router(debt_router)
@@ -71,4 +86,5 @@ if __name__ == "__main__":
         logging.info("Bot stopped.")
     finally:
         scheduler_manager.shutdown()
-        asyncio.run(close_pool())
\ No newline at end of file
+        asyncio.run(close_pool())
+        asyncio.run(close_job_db())
\ No newline at end of file
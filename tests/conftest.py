@@ -2,24 +2,48 @@
 This file contains shared fixtures for the test suite.
 """
 
+import functools
+import importlib
+import itertools
+import json
 import os
 import sys
 import types
 import time
-import uuid
 import logging
 
 import pytest
 import pytest_asyncio
+from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, patch, MagicMock
 
+from aiogram import Bot
+from aiogram.types import CallbackQuery, Chat, InlineQuery, Message, User
+
+# Unique ids for mocked callback/inline queries; a counter is enough, no need for uuid4 randomness
+_ids = itertools.count(1)
+
 # Set env vars before any application modules are imported
 os.environ.setdefault("BOT_TOKEN", "test_token")
 os.environ.setdefault("BOT_ADMIN_ID", "123")
 os.environ.setdefault("DATABASE_PATH", ":memory:")
+# Test databases are throwaway, so commits need not wait for the disk
+os.environ.setdefault("DB_SYNCHRONOUS", "OFF")
 os.environ.setdefault("PYTHONIOENCODING", "utf-8")
 
 
+def pytest_collection_modifyitems(items):
+    """
+    Run every async test on one session-wide event loop instead of a fresh loop per test.
+    The async fixtures declare the same loop scope, so connections they open stay usable in the tests.
+    """
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if item.get_closest_marker("asyncio") is not None:
+            # prepend, so it wins over a bare @pytest.mark.asyncio on the test itself
+            item.add_marker(session_loop, append=False)
+
+
 @pytest.fixture(scope="session", autouse=True)
 def recursion_limit_safety():
     """
@@ -85,7 +109,6 @@ def mock_bot_config_before_imports():
 @pytest.fixture(scope="session", autouse=True)
 def mock_aiogram_bot():
     """Provide universal bot mock to prevent mounting errors."""
-    from aiogram import Bot
 
     dummy_bot = AsyncMock(spec=Bot)
     dummy_bot.token = "test_token"
@@ -101,16 +124,24 @@ def mock_aiogram_bot():
     yield dummy_bot
 
 
+@pytest.fixture(autouse=True)
+def reset_aiogram_bot(mock_aiogram_bot):
+    """
+    Clear the shared bot mock's call history, return values and side effects after each test.
+    Plain attributes such as ``token`` and ``id`` are not touched by ``reset_mock()``.
+    """
+    yield
+    mock_aiogram_bot.reset_mock(return_value=True, side_effect=True)
+
+
 @pytest.fixture(scope="session", autouse=True)
 def stub_apscheduler():
     """
     Stubs APScheduler classes to prevent exploring real scheduler implementations.
     """
     import apscheduler.schedulers.asyncio as async_mod
-    import apscheduler.jobstores.sqlalchemy as sqlalchemy_mod
 
     OriginalScheduler = async_mod.AsyncIOScheduler
-    OriginalJobStore = sqlalchemy_mod.SQLAlchemyJobStore
 
     class DummyScheduler:
         def __init__(self, gconfig=None, jobstores=None, executors=None, job_defaults=None, timezone=None, logger=None):
@@ -141,11 +172,7 @@ def stub_apscheduler():
         def add_job(self, func, trigger=None, id=None, **kwargs):
             job_id = id or str(self._next_id)
             self._next_id += 1
-            job = MagicMock()
-            job.id = job_id
-            job.func = func
-            job.trigger = trigger
-            job.kwargs = kwargs
+            job = types.SimpleNamespace(id=job_id, func=func, trigger=trigger, kwargs=kwargs)
             self.jobs[job_id] = job
             return job
 
@@ -175,61 +202,24 @@ def stub_apscheduler():
         def get_jobs(self):
             return list(self.jobs.values())
 
-    class DummyJobStore:
-        def __init__(self, url=None, metadata=None, tablename=None, pickle_protocol=None, **kwargs):
-            self.url = url
-            self.metadata = metadata
-            self.tablename = tablename
-            self.pickle_protocol = pickle_protocol
-            self.jobs = {}
-            self.engine = None
-
-        def add_job(self, job):
-            self.jobs[job.id] = job
-
-        def update_job(self, job):
-            self.jobs[job.id] = job
-
-        def remove_job(self, job_id):
-            return self.jobs.pop(job_id, None)
-
-        def remove_all_jobs(self):
-            self.jobs.clear()
-
-        def get_due_jobs(self, now):
-            return list(self.jobs.values())
-
-        def get_next_run_time(self):
-            return None
-
-        def get_all_jobs(self):
-            return list(self.jobs.values())
-
     async_mod.AsyncIOScheduler = DummyScheduler  # type: ignore
-    sqlalchemy_mod.SQLAlchemyJobStore = DummyJobStore  # type: ignore
 
     assert async_mod.AsyncIOScheduler is DummyScheduler
-    assert sqlalchemy_mod.SQLAlchemyJobStore is DummyJobStore
 
     # Patch already-imported scheduler_manager if present
     sm_module = sys.modules.get("bot.scheduler.scheduler_manager")
     if sm_module is not None:
         if hasattr(sm_module, "AsyncIOScheduler"):
             sm_module.AsyncIOScheduler = DummyScheduler  # type: ignore
-        if hasattr(sm_module, "SQLAlchemyJobStore"):
-            sm_module.SQLAlchemyJobStore = DummyJobStore  # type: ignore
 
     yield
 
     async_mod.AsyncIOScheduler = OriginalScheduler
-    sqlalchemy_mod.SQLAlchemyJobStore = OriginalJobStore
     # Restore scheduler_manager module if it was patched
     sm_module = sys.modules.get("bot.scheduler.scheduler_manager")
     if sm_module is not None:
         if hasattr(sm_module, "AsyncIOScheduler"):
             sm_module.AsyncIOScheduler = OriginalScheduler  # type: ignore
-        if hasattr(sm_module, "SQLAlchemyJobStore"):
-            sm_module.SQLAlchemyJobStore = OriginalJobStore  # type: ignore
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -248,46 +238,143 @@ def patch_handlers_common():
         "bot.handlers.language_handlers",
     ]
 
+    # UserRepository only has classmethods, so one instance can serve every module
+    shared = {"user_repo": UserRepository(), "_": lambda msg: msg}
     for mod_name in handler_modules:
         try:
-            module = __import__(mod_name, fromlist=["*"])
+            module = importlib.import_module(mod_name)
         except ImportError:
             logging.warning(f"Handler module {mod_name} not found, skipping patch")
             continue
-        setattr(module, "user_repo", UserRepository())
-        setattr(module, "_", lambda msg: msg)
-        setattr(module, "logger", logging.getLogger(mod_name))
-        if not hasattr(module, "user_repo") or not hasattr(module, "_"):
-            raise RuntimeError(f"Failed to patch handler module {mod_name}")
+        namespace = vars(module)
+        namespace.update(shared)
+        namespace["logger"] = logging.getLogger(mod_name)
 
     yield
 
 
-@pytest.fixture(autouse=True)
-def reset_db_connection_pool():
+# Every table except SQLite's internal ones; sqlite_sequence is kept so AUTOINCREMENT ids restart
+_USER_TABLES_SQL = (
+    "SELECT name FROM sqlite_master WHERE type = 'table' "
+    "AND (name NOT LIKE 'sqlite_%' OR name = 'sqlite_sequence')"
+)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def db_modules():
     """
-    Reset the SQLite connection pool between tests to ensure isolation.
+    Resolve the connection and repository modules once for the per-test pool reset,
+    and close the shared connection pool when the session ends.
+    Runs on the session event loop, the same one the tests open the pool from.
     """
     try:
         import bot.db.connection as db_conn
-        setattr(db_conn, "_pool_initialized", False)
-        setattr(db_conn, "_pool", None)
+        import bot.db.repositories as db_repos
     except ImportError:
-        pass
+        yield None
+        return
+    yield db_conn, db_repos
+    # aiosqlite worker threads are not daemonic; an unclosed connection keeps the process alive
+    await db_conn.close_pool()
+
+
+@pytest_asyncio.fixture(autouse=True, loop_scope="session")
+async def reset_db_connection_pool(db_modules):
+    """
+    Give every test an empty database.
+    The shared in-memory pool keeps its schema and only has its rows deleted; any other pool
+    (e.g. a test's temporary file database) is closed. Stays autouse: handler tests reach the
+    pool indirectly through the repositories.
+    """
+    if db_modules is not None:
+        db_conn, db_repos = db_modules
+        db_repos.UserRepository.clear_cache()
+        if db_conn._pool_initialized and db_conn.DATABASE_PATH == ":memory:":
+            async with db_conn.get_connection() as conn:
+                cursor = await conn.execute(_USER_TABLES_SQL)
+                tables = [row[0] for row in await cursor.fetchall()]
+                await conn.executescript(
+                    "PRAGMA foreign_keys = OFF;"
+                    + "".join(f'DELETE FROM "{table}";' for table in tables)
+                    + "PRAGMA foreign_keys = ON;"
+                )
+        else:
+            await db_conn.close_pool()
     yield
 
 
+@pytest_asyncio.fixture(autouse=True, loop_scope="session")
+async def close_job_db():
+    """
+    Close the scheduler jobs' shared connection after each test so every test opens its own.
+    """
+    yield
+    import bot.scheduler.jobs as jobs
+    await jobs.close_db()
+
+
+@pytest.fixture
+def bulk_seed(db_modules):
+    """
+    Factory inserting test users and debts in a single transaction.
+
+    ``users`` are usernames; ``debts`` are ``(creditor, debtor, amount, description, status)``
+    tuples referring to those usernames. Returns ``(user_ids, debt_ids)``: a username -> user_id
+    mapping and the new debt ids in the order given.
+    """
+    db_conn, _ = db_modules
+
+    async def _seed(users=(), debts=()):
+        users = [name.lower() for name in users]
+        debts = list(debts)
+        async with db_conn.get_connection() as conn:
+            await conn.execute("BEGIN")
+            try:
+                await conn.executemany(
+                    "INSERT INTO users (username, first_name) VALUES (?, ?)",
+                    [(name, name) for name in users],
+                )
+                cursor = await conn.execute(
+                    "SELECT username, user_id FROM users WHERE username IN (SELECT value FROM json_each(?))",
+                    (json.dumps(users),),
+                )
+                user_ids = {row["username"]: row["user_id"] for row in await cursor.fetchall()}
+                await conn.executemany(
+                    "INSERT INTO debts (creditor_id, debtor_id, amount, description, status) VALUES (?, ?, ?, ?, ?)",
+                    [
+                        (user_ids[creditor.lower()], user_ids[debtor.lower()], amount, description, status)
+                        for creditor, debtor, amount, description, status in debts
+                    ],
+                )
+                cursor = await conn.execute("SELECT debt_id FROM debts ORDER BY debt_id DESC LIMIT ?", (len(debts),))
+                debt_ids = sorted(row["debt_id"] for row in await cursor.fetchall())
+                await conn.commit()
+            except Exception:
+                await conn.rollback()
+                raise
+        return user_ids, debt_ids
+
+    return _seed
+
+
 # Aiogram model fixtures
 
+# aiogram models are frozen, so the default user and chat can be shared by every test
+_DEFAULT_USER = User.model_construct(
+    id=123, is_bot=False, first_name="Test", username="testuser", language_code="en"
+)
+_DEFAULT_CHAT = Chat.model_construct(id=456, type="private")
+
 @pytest.fixture
 def model_user():
     """
     Factory for aiogram.types.User using model_construct to bypass validation.
     """
-    from aiogram.types import User
 
     def factory(id: int = 123, is_bot: bool = False, first_name: str = "Test",
                 username: str = "testuser", language_code: str = "en", **kwargs):
+        if (id, is_bot, first_name, username, language_code) == (123, False, "Test", "testuser", "en") and not kwargs:
+            return _DEFAULT_USER
         return User.model_construct(
             id=id,
             is_bot=is_bot,
@@ -305,9 +392,10 @@ def model_chat():
     """
     Factory for aiogram.types.Chat.
     """
-    from aiogram.types import Chat
 
     def factory(id: int = 456, type: str = "private", **kwargs):
+        if id == 456 and type == "private" and not kwargs:
+            return _DEFAULT_CHAT
         if type in ("group", "supergroup") and "title" not in kwargs:
             kwargs["title"] = f"Chat {id}"
         if type == "channel" and "username" not in kwargs:
@@ -363,7 +451,6 @@ def model_callback_query(model_user, model_message):
     """
     Factory for aiogram.types.CallbackQuery.
     """
-    from aiogram.types import CallbackQuery
 
     def factory(
         id: str = None,
@@ -378,9 +465,9 @@ def model_callback_query(model_user, model_message):
         from_user = from_user or model_user()
         message = message or model_message()
         return CallbackQuery.model_construct(
-            id=id or str(uuid.uuid4()),
+            id=id or f"cb-{next(_ids)}",
             from_user=from_user,
-            chat_instance=chat_instance or str(uuid.uuid4()),
+            chat_instance=chat_instance or f"ci-{next(_ids)}",
             message=message,
             data=data,
             inline_message_id=inline_message_id,
@@ -396,7 +483,6 @@ def model_inline_query(model_user):
     """
     Factory for aiogram.types.InlineQuery.
     """
-    from aiogram.types import InlineQuery
 
     def factory(
         id: str = None,
@@ -409,7 +495,7 @@ def model_inline_query(model_user):
     ):
         from_user = from_user or model_user()
         return InlineQuery.model_construct(
-            id=id or str(uuid.uuid4()),
+            id=id or f"iq-{next(_ids)}",
             from_user=from_user,
             query=query or "test query",
             offset=str(offset),
@@ -435,7 +521,7 @@ def mock_user_repo() -> AsyncMock:
     return AsyncMock(spec=UserRepository)
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(loop_scope="session")
 async def mock_repositories():
     """
     Async fixture that provides mocked DebtRepository and UserRepository
@@ -456,7 +542,7 @@ async def mock_repositories():
         yield mock_debt, mock_user
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(loop_scope="session")
 async def mock_notification_service(mock_aiogram_bot):
     """
     Async fixture that provides a mocked NotificationService instance
@@ -475,10 +561,11 @@ async def mock_notification_service(mock_aiogram_bot):
         yield instance
 
 
-@pytest_asyncio.fixture
-async def sample_users():
+@pytest.fixture(scope="session")
+def sample_users():
     """
-    Async fixture yielding sample User models: creditor, debtor, unregistered.
+    Session fixture yielding sample User models: creditor, debtor, unregistered.
+    The models are shared read-only; tests that need to change one should ``model_copy()`` it.
     """
     from bot.db.models import User
     creditor = User(user_id=1, username='creditor', first_name='John', language_code='en')
@@ -487,13 +574,12 @@ async def sample_users():
     return creditor, debtor, unregistered
 
 
-@pytest_asyncio.fixture
-async def sample_debts(sample_users):
+@pytest.fixture(scope="session")
+def sample_debts(sample_users):
     """
-    Async fixture yielding sample Debt models: recent, old, unregistered debt.
+    Session fixture yielding sample Debt models: recent, old, unregistered debt.
     """
     from bot.db.models import Debt
-    from datetime import datetime, timezone, timedelta
     creditor, debtor, unregistered_user = sample_users
     now = datetime.now(timezone.utc)
     recent = Debt(debt_id=1, creditor_id=creditor.user_id, debtor_id=debtor.user_id,
@@ -510,7 +596,6 @@ async def sample_debts(sample_users):
 @pytest.fixture
 def mock_message():
     """Mutable mock for aiogram.types.Message with AsyncMock methods."""
-    from aiogram.types import Message
     m = MagicMock(spec=Message)
     m.answer = AsyncMock()
     m.edit_text = AsyncMock()
@@ -524,7 +609,6 @@ def mock_message():
 @pytest.fixture
 def mock_callback_query(mock_message):
     """Mutable mock for aiogram.types.CallbackQuery with associated message."""
-    from aiogram.types import CallbackQuery
     cq = MagicMock(spec=CallbackQuery)
     cq.answer = AsyncMock()
     cq.data = ""
@@ -536,7 +620,6 @@ def mock_callback_query(mock_message):
 
 def make_mutable_message(**kwargs):
     """Create a mutable mock Message with AsyncMock methods."""
-    from aiogram.types import Message
     mock = MagicMock(spec=Message)
     mock.answer = AsyncMock()
     mock.edit_text = AsyncMock()
@@ -551,10 +634,9 @@ def make_mutable_message(**kwargs):
 
 def make_mutable_inline_query(**kwargs):
     """Create a mutable mock InlineQuery with AsyncMock methods."""
-    from aiogram.types import InlineQuery
     mock = MagicMock(spec=InlineQuery)
     mock.answer = AsyncMock()
-    mock.id = kwargs.get('id', str(uuid.uuid4()))
+    mock.id = kwargs.get('id') or f"iq-{next(_ids)}"
     mock.query = kwargs.get('query', '')
     mock.from_user = kwargs.get('from_user') or MagicMock()
     mock.offset = kwargs.get('offset', '')
@@ -563,10 +645,9 @@ def make_mutable_inline_query(**kwargs):
 
 def make_mutable_callback_query(**kwargs):
     """Create a mutable mock CallbackQuery with AsyncMock methods."""
-    from aiogram.types import CallbackQuery
     mock = MagicMock(spec=CallbackQuery)
     mock.answer = AsyncMock()
-    mock.id = kwargs.get('id', str(uuid.uuid4()))
+    mock.id = kwargs.get('id') or f"cb-{next(_ids)}"
     mock.data = kwargs.get('data', '')
     mock.from_user = kwargs.get('from_user') or MagicMock()
     mock.message = kwargs.get('message') or make_mutable_message()
@@ -589,34 +670,38 @@ def mock_payment_manager():
     return AsyncMock(spec=PaymentManager)
 
 
+def _memoize_copies(func):
+    """Memoize *func* but hand every caller its own deep copy, since keyboard markups are mutable."""
+    cached = functools.lru_cache(maxsize=None)(func)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return cached(*args, **kwargs).model_copy(deep=True)
+
+    return wrapper
+
+
+@pytest.fixture(scope="session")
+def cached_confirmation_kbs():
+    """
+    Memoized keyboard generators shared by the whole session.
+    Keyboards are deterministic for given ids and language, so each distinct call is rendered once;
+    callers get a copy, so a test that edits its markup cannot leak into later tests.
+    """
+    from bot.keyboards.debt_kbs import get_debt_confirmation_kb, get_payment_confirmation_kb
+    return (
+        _memoize_copies(get_debt_confirmation_kb),
+        _memoize_copies(get_payment_confirmation_kb),
+    )
+
+
 @pytest.fixture
-def mock_get_debt_confirmation_kb():
-    """Returns an AsyncMock wrapping the debt confirmation keyboard generator."""
-    from bot.keyboards.debt_kbs import get_debt_confirmation_kb
-    return AsyncMock(wraps=get_debt_confirmation_kb)
+def mock_get_debt_confirmation_kb(cached_confirmation_kbs):
+    """Returns an AsyncMock wrapping the (memoized) debt confirmation keyboard generator."""
+    return AsyncMock(wraps=cached_confirmation_kbs[0])
 
 
 @pytest.fixture
-def mock_get_payment_confirmation_kb():
-    """Returns an AsyncMock wrapping the payment confirmation keyboard generator."""
-    from bot.keyboards.debt_kbs import get_payment_confirmation_kb
-    return AsyncMock(wraps=get_payment_confirmation_kb)
-
-
-# Handler modules patch validation
-for mod_name in [
-    "bot.handlers.common",
-    "bot.handlers.debt_handlers",
-    "bot.handlers.payment_handlers",
-    "bot.handlers.profile_handlers",
-    "bot.handlers.inline_handlers",
-    "bot.handlers.language_handlers",
-]:
-    try:
-        module = __import__(mod_name, fromlist=["*"])
-        assert hasattr(module, "user_repo"), f"{mod_name} missing user_repo patch"
-        assert hasattr(module, "_"), f"{mod_name} missing localization function patch"
-    except ImportError:
-        logging.warning(f"Handler module {mod_name} not found during validation")
-    except AssertionError as ae:
-        logging.error(str(ae))
\ No newline at end of file
+def mock_get_payment_confirmation_kb(cached_confirmation_kbs):
+    """Returns an AsyncMock wrapping the (memoized) payment confirmation keyboard generator."""
+    return AsyncMock(wraps=cached_confirmation_kbs[1])
@@ -1,48 +1,52 @@
+"""Debt confirmation callback tests."""
+
 import json
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock
 
 import pytest
 
+from bot.handlers import debt_handlers
 from bot.handlers.debt_handlers import handle_debt_callback
 from bot.db.models import Debt, User
+from tests._fakes import FakeNotifier
 
 
 pytestmark = pytest.mark.asyncio
 
 
-async def test_notify_creditor_on_accept(model_callback_query):
+@pytest.fixture
+def patched_debt_handlers(monkeypatch):
+    """Stub the creditor lookup, localization and formatting used by the debt callbacks."""
+    monkeypatch.setattr(
+        debt_handlers.UserRepository,
+        "get_by_id",
+        AsyncMock(return_value=User(user_id=1, username="creditor", first_name="c")),
+    )
+    monkeypatch.setattr(debt_handlers, "_", lambda k, **kwargs: k)
+    monkeypatch.setattr(debt_handlers, "format_amount", lambda x: str(x))
+    return debt_handlers
+
+
+async def test_notify_creditor_on_accept(model_callback_query, patched_debt_handlers, monkeypatch):
     cb = model_callback_query(data=json.dumps({"action": "debt_agree", "debt_id": 1}))
     cb.message.edit_text = AsyncMock()
     object.__setattr__(cb, "answer", AsyncMock())
-    service = AsyncMock()
-    service.send_message = AsyncMock()
+    service = FakeNotifier()
     debt = Debt(debt_id=1, creditor_id=1, debtor_id=cb.from_user.id, amount=100, description="", status="active")
-    with patch("bot.handlers.debt_handlers.DebtManager.confirm_debt", AsyncMock(return_value=debt)), patch(
-        "bot.handlers.debt_handlers.UserRepository.get_by_id",
-        AsyncMock(return_value=User(user_id=1, username="creditor", first_name="c")),
-    ), patch("bot.handlers.debt_handlers._", lambda k, **kwargs: k), patch(
-        "bot.handlers.debt_handlers.format_amount", lambda x: str(x)
-    ):
-        await handle_debt_callback(cb, service, lambda key, **kwargs: key)
-        service.send_message.assert_called_once()
+    monkeypatch.setattr(patched_debt_handlers.DebtManager, "confirm_debt", AsyncMock(return_value=debt))
+
+    await handle_debt_callback(cb, service, lambda key, **kwargs: key)
+    assert [name for name, *_ in service.calls] == ["send_message"]
 
 
-async def test_notify_creditor_on_decline(model_callback_query):
+async def test_notify_creditor_on_decline(model_callback_query, patched_debt_handlers, monkeypatch):
     cb = model_callback_query(data=json.dumps({"action": "debt_decline", "debt_id": 1}))
     cb.message.edit_text = AsyncMock()
     object.__setattr__(cb, "answer", AsyncMock())
-    service = AsyncMock()
-    service.send_message = AsyncMock()
+    service = FakeNotifier()
     debt = Debt(debt_id=1, creditor_id=1, debtor_id=cb.from_user.id, amount=100, description="", status="pending")
-    with patch("bot.handlers.debt_handlers.DebtRepository.get", AsyncMock(return_value=debt)), patch(
-        "bot.handlers.debt_handlers.DebtRepository.update_status", AsyncMock()
-    ), patch(
-        "bot.handlers.debt_handlers.UserRepository.get_by_id",
-        AsyncMock(return_value=User(user_id=1, username="creditor", first_name="c")),
-    ), patch(
-        "bot.handlers.debt_handlers._", lambda k, **kwargs: k
-    ), patch(
-        "bot.handlers.debt_handlers.format_amount", lambda x: str(x)
-    ):
-        await handle_debt_callback(cb, service, lambda key, **kwargs: key)
-        service.send_message.assert_called_once()
+    monkeypatch.setattr(patched_debt_handlers.DebtRepository, "get", AsyncMock(return_value=debt))
+    monkeypatch.setattr(patched_debt_handlers.DebtRepository, "update_status", AsyncMock())
+
+    await handle_debt_callback(cb, service, lambda key, **kwargs: key)
+    assert [name for name, *_ in service.calls] == ["send_message"]
@@ -4,6 +4,8 @@ These tests drive Issue 3 logic: pending confirmation, manual acceptance,
 and auto-accept when debtor trusts creditor.
 """
 
+import logging
+
 import pytest  # type: ignore
 
 from bot.core import DebtManager
@@ -12,6 +14,8 @@ from bot.db.repositories import DebtRepository, UserRepository
 AUTHOR = "creditor"
 DEBTOR = "debtor1"
 
+logger = logging.getLogger(__name__)
+
 
 @pytest.mark.asyncio
 async def test_debt_is_pending_after_creation() -> None:
@@ -33,121 +37,64 @@ async def test_manual_confirmation_changes_status() -> None:
 
 
 @pytest.mark.asyncio
-async def test_auto_confirmation_when_trusted() -> None:
+async def test_auto_confirmation_when_trusted(bulk_seed) -> None:
     # Setup both users: creditor and debtor
-    creditor_user = await UserRepository.add(AUTHOR)
-    debtor_user = await UserRepository.add(DEBTOR)
+    user_ids, _ = await bulk_seed(users=[AUTHOR, DEBTOR])
+    debtor_id = user_ids[DEBTOR]
 
     # Debtor trusts creditor, so debts from creditor should auto-confirm
-    if creditor_user.username:
-        await UserRepository.add_trust(debtor_user.user_id, creditor_user.username)
+    await UserRepository.add_trust(debtor_id, AUTHOR)
 
     # Diagnostic: verify trust relationship is properly established
-    trust_exists = await UserRepository.trusts(debtor_user.user_id, AUTHOR)
+    trust_exists = await UserRepository.trusts(debtor_id, AUTHOR)
     assert trust_exists, f"Expected trust relationship: debtor '{DEBTOR}' should trust creditor '{AUTHOR}'"
-    # Debug output for trust relationship
-    print(f"Debug: trust_exists={trust_exists} (debtor={debtor_user.user_id}, creditor='{AUTHOR}')")
+    logger.debug("trust_exists=%s (debtor=%s, creditor=%r)", trust_exists, debtor_id, AUTHOR)
 
     # Ensure no pre-existing debts for clarity
-    existing = await DebtRepository.list_active_by_user(debtor_user.user_id)
-    # Debug output for existing debts before creation
-    print(f"Debug: existing active debts for debtor before creation = {existing}")
+    existing = await DebtRepository.list_active_by_user(debtor_id)
+    logger.debug("existing active debts for debtor before creation = %s", existing)
 
     # Process a new debt creation
     debts = await DebtManager.process_message(f"@{DEBTOR} 800 кино", author_username=AUTHOR)
     assert len(debts) == 1, f"Expected exactly one debt created, got {len(debts)}"
     debt = debts[0]
 
-    # Debug output for debt status after creation
-    print(f"Debug: debt.status={debt.status} (debt_id={debt.debt_id})")
+    logger.debug("debt.status=%s (debt_id=%s)", debt.status, debt.debt_id)
     # When debtor trusts the creditor the debt should be active immediately
     assert debt.status == "active"
 
 
-@pytest.mark.asyncio
-async def test_confirm_debt_offsets_existing_opposite_debt() -> None:
-    """Confirming a debt should offset any active debt in the opposite direction."""
-    user1 = await UserRepository.add("user1")
-    user2 = await UserRepository.add("user2")
-
-    existing = await DebtRepository.add(
-        creditor_id=user2.user_id,
-        debtor_id=user1.user_id,
-        amount=2000,
-        description="initial",
-    )
-    await DebtRepository.update_status(existing.debt_id, "active")
-
-    reverse = await DebtRepository.add(
-        creditor_id=user1.user_id,
-        debtor_id=user2.user_id,
-        amount=1000,
-        description="reverse",
-    )
-
-    confirmed = await DebtManager.confirm_debt(reverse.debt_id, debtor_username="user2")
-    assert confirmed.status == "paid"
-
-    updated = await DebtRepository.get(existing.debt_id)
-    assert updated.amount == 1000
-    assert updated.status == "active"
+# (existing active debt, new pending debt, confirm returns the existing debt,
+#  existing debt afterwards, new debt afterwards); debts are (creditor, debtor, amount)
+# and states are (status, amount)
+CONFIRM_CASES = [
+    # an opposite debt at least as large absorbs the new one
+    (("beta", "alpha", 2000), ("alpha", "beta", 1000), False, ("active", 1000), ("paid", 1000)),
+    # a larger new debt keeps the remainder after offsetting the existing one
+    (("alpha", "beta", 500), ("beta", "alpha", 1000), False, ("paid", 500), ("active", 500)),
+    # a same-direction debt is increased instead of keeping a second one
+    (("alpha", "beta", 700), ("alpha", "beta", 300), True, ("active", 1000), ("paid", 300)),
+]
 
 
 @pytest.mark.asyncio
-async def test_confirm_debt_offsets_and_reduces_new_debt() -> None:
-    """Remaining amount should stay with new debt if it's larger than existing."""
-    user1 = await UserRepository.add("alpha")
-    user2 = await UserRepository.add("beta")
-
-    existing = await DebtRepository.add(
-        creditor_id=user1.user_id,
-        debtor_id=user2.user_id,
-        amount=500,
-        description="initial",
-    )
-    await DebtRepository.update_status(existing.debt_id, "active")
-
-    reverse = await DebtRepository.add(
-        creditor_id=user2.user_id,
-        debtor_id=user1.user_id,
-        amount=1000,
-        description="reverse",
-    )
-
-    confirmed = await DebtManager.confirm_debt(reverse.debt_id, debtor_username="alpha")
-    assert confirmed.status == "active"
-    assert confirmed.amount == 500
-
-    updated = await DebtRepository.get(existing.debt_id)
-    assert updated.status == "paid"
-
-
-@pytest.mark.asyncio
-async def test_confirm_debt_merges_existing_same_direction_debt() -> None:
-    """Confirming a debt should increase existing active debt instead of creating another."""
-
-    user1 = await UserRepository.add("gamma")
-    user2 = await UserRepository.add("delta")
-
-    existing = await DebtRepository.add(
-        creditor_id=user1.user_id,
-        debtor_id=user2.user_id,
-        amount=700,
-        description="first",
-    )
-    await DebtRepository.update_status(existing.debt_id, "active")
-
-    new_debt = await DebtRepository.add(
-        creditor_id=user1.user_id,
-        debtor_id=user2.user_id,
-        amount=300,
-        description="second",
+@pytest.mark.parametrize(
+    "existing, new, returns_existing, existing_after, new_after",
+    CONFIRM_CASES,
+    ids=["offsets_existing_opposite_debt", "offsets_and_reduces_new_debt", "merges_existing_same_direction_debt"],
+)
+async def test_confirm_debt_against_existing_debt(
+    bulk_seed, existing, new, returns_existing, existing_after, new_after
+) -> None:
+    """Confirming a debt should settle it against the active debt already between the two users."""
+    _, (existing_id, new_id) = await bulk_seed(
+        users=["alpha", "beta"],
+        debts=[(*existing, "existing", "active"), (*new, "new", "pending")],
     )
 
-    merged = await DebtManager.confirm_debt(new_debt.debt_id, debtor_username="delta")
-    assert merged.debt_id == existing.debt_id
-    assert merged.amount == 1000
-    assert merged.status == "active"
+    confirmed = await DebtManager.confirm_debt(new_id, debtor_username=new[1])
+    assert confirmed.debt_id == (existing_id if returns_existing else new_id)
 
-    updated_new = await DebtRepository.get(new_debt.debt_id)
-    assert updated_new.status == "paid"
+    for debt_id, (status, amount) in ((existing_id, existing_after), (new_id, new_after)):
+        debt = await DebtRepository.get(debt_id)
+        assert (debt.status, debt.amount) == (status, amount)
@@ -1,19 +1,24 @@
+"""Debt handler message tests."""
+
 import pytest
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock
 
+from bot.handlers import debt_handlers
 from bot.handlers.debt_handlers import handle_debt_message
 from bot.core.debt_parser import DebtParseError
+from tests._fakes import FakeNotifier
 
 
 @pytest.mark.asyncio
-async def test_invalid_debt_message_sends_help(model_message):
+async def test_invalid_debt_message_sends_help(model_message, monkeypatch):
     msg = model_message(text="@bad")
     msg.reply = AsyncMock()
-    bot = AsyncMock()
-    service = AsyncMock()
-    with patch(
-        "bot.handlers.debt_handlers.DebtManager.process_message",
+    service = FakeNotifier()
+    monkeypatch.setattr(
+        debt_handlers.DebtManager,
+        "process_message",
         AsyncMock(side_effect=DebtParseError("invalid_username_format")),
-    ):
-        await handle_debt_message(msg, bot, service, lambda k, **kwargs: k)
+    )
+    await handle_debt_message(msg, AsyncMock(), service, lambda k, **kwargs: k)
     msg.reply.assert_called_once_with("unknown_command")
+    assert not service.calls
@@ -1,33 +1,35 @@
 import pytest
-from unittest.mock import AsyncMock, patch
 
 from bot.db.models import User
 
 from bot.handlers.debt_handlers import handle_debt_message
 from bot.db.models import Debt
 from bot.core.notification_service import NotificationService
+from tests._fakes import AsyncRecorder
+
+# Read-only records shared by the tests, built once at import
+CREDITOR = User(user_id=1, username="cred", first_name="Cred", language_code="ru")
+DEBTOR = User(user_id=2, username="deb", first_name="Deb", language_code="ru")
+DEBT = Debt(
+    debt_id=10,
+    creditor_id=1,
+    debtor_id=2,
+    amount=15000,
+    description="обед",
+    status="pending",
+)
+
 
 @pytest.mark.asyncio
 async def test_debt_confirmation_localized(mock_aiogram_bot):
     service = NotificationService(mock_aiogram_bot)
-    service.send_message = AsyncMock(return_value=True)
-
-    creditor = User(user_id=1, username="cred", first_name="Cred", language_code="ru")
-    debtor = User(user_id=2, username="deb", first_name="Deb", language_code="ru")
-    debt = Debt(
-        debt_id=10,
-        creditor_id=1,
-        debtor_id=2,
-        amount=15000,
-        description="обед",
-        status="pending",
-    )
+    service.send_message = AsyncRecorder(return_value=True)
 
-    await service.send_debt_confirmation_request(debt, creditor, debtor)
+    await service.send_debt_confirmation_request(DEBT, CREDITOR, DEBTOR)
 
-    service.send_message.assert_called_once()
-    args, _ = service.send_message.call_args
-    assert args[0] == debtor.user_id
+    assert len(service.send_message.calls) == 1
+    args, _ = service.send_message.calls[0]
+    assert args[0] == DEBTOR.user_id
     assert "cred" in args[1]
     assert "150" in args[1]
-    assert "обед" in args[1]
\ No newline at end of file
+    assert "обед" in args[1]
@@ -22,6 +22,10 @@ def author():
         ("@user3 500+200 ужин", {"user3": (70000, "ужин")}),
         # Division expression
         ("@user4 3000/3", {"user4": (100000, "")}),
+        # Fractional result rounds half-up on exact decimal arithmetic
+        ("@user5 .7/.2", {"user5": (400, "")}),
+        # Exact half reached through a repeating fraction still rounds up
+        ("@user6 65/62*93", {"user6": (9800, "")}),
         # 'я' keyword for splitting
         (
             "я @user1 @user2 3000/3 торт",
@@ -43,6 +47,8 @@ def author():
         "multi-user-same-amount",
         "arithmetic-addition",
         "arithmetic-division",
+        "arithmetic-decimal-rounding",
+        "arithmetic-exact-half-rounding",
         "ya-keyword-splitting",
         "multi-line-aggregation",
         "complex-multi-line-aggregation",
@@ -84,8 +90,9 @@ def test_debt_parser_happy_path(message, expected, author):
     ],
 )
 def test_debt_parser_error_path(message, error_message, author):
-    with pytest.raises(DebtParseError, match=error_message):
+    with pytest.raises(DebtParseError) as exc_info:
         DebtParser.parse(message, author)
+    assert exc_info.value.key == error_message
 
 
 def test_username_case_insensitive(author):
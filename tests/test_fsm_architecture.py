@@ -277,7 +277,7 @@ class TestInputValidation:
              patch('bot.handlers.profile_handlers.get_user_language') as mock_lang, \
              patch('bot.handlers.profile_handlers.get_localization') as mock_loc, \
              patch('bot.handlers.profile_handlers.is_valid_contact_info') as mock_validate, \
-             patch('bot.handlers.profile_handlers.settings_handler') as mock_settings:
+             patch('bot.handlers.profile_handlers._render_settings') as mock_settings:
             
             mock_lang.return_value = "en"
             mock_loc.return_value.profile_contact_saved = "Contact saved"
@@ -353,6 +353,7 @@ class TestErrorHandling:
              patch('bot.handlers.profile_handlers.get_localization') as mock_loc:
             
             mock_lang.return_value = "en"
+            mock_loc.return_value.settings_buttons = {}
             mock_loc.return_value.ERROR_INVALID_STATE = "Invalid state"
             
             from bot.handlers.profile_handlers import settings_handler
@@ -425,14 +426,18 @@ class TestLoggingMiddleware:
         handler = AsyncMock()
         data = {"event_from_user": mock_update.message.from_user}
         
-        with patch('bot.middlewares.logging_middleware.uuid.uuid4') as mock_uuid:
-            mock_uuid.return_value = uuid.UUID('12345678-1234-5678-9012-123456789012')
+        with patch('bot.middlewares.logging_middleware._next_correlation_id') as mock_cid:
+            mock_cid.return_value = "1a2b3c4d-1"
             
             await logging_middleware(handler, mock_update, data)
             
             # Verify correlation ID was added to data
             assert "correlation_id" in data
-            assert data["correlation_id"] == "12345678-1234-5678-9012-123456789012"
+            assert data["correlation_id"] == "1a2b3c4d-1"
+
+        # Real IDs are unique per update
+        from bot.middlewares.logging_middleware import _next_correlation_id
+        assert _next_correlation_id() != _next_correlation_id()
     
     @pytest.mark.asyncio
     async def test_structured_logging_format(self, logging_middleware, mock_update, caplog):
@@ -448,6 +453,32 @@ class TestLoggingMiddleware:
         assert "correlation_id" in log_record.getMessage()
         assert "user_id=12345" in log_record.getMessage()
         assert "update_type=message" in log_record.getMessage()
+
+    @pytest.mark.asyncio
+    async def test_structured_logging_omits_missing_fields(self, logging_middleware, mock_update, caplog):
+        """Test that context fields without a value are left out of the log line."""
+        handler = AsyncMock()
+
+        with caplog.at_level(logging.INFO):
+            await logging_middleware(handler, mock_update, {})
+
+        for record in caplog.records:
+            assert "=None" not in record.getMessage()
+
+    @pytest.mark.asyncio
+    async def test_structured_logging_sets_record_attributes(self, logging_middleware, mock_update, caplog):
+        """Test that INFO records carry the context fields as LogRecord attributes."""
+        handler = AsyncMock()
+        data = {"event_from_user": mock_update.message.from_user}
+
+        with caplog.at_level(logging.INFO):
+            await logging_middleware(handler, mock_update, data)
+
+        for prefix in ("Incoming update", "Handler processed"):
+            record = next(r for r in caplog.records if r.getMessage().startswith(prefix))
+            assert record.correlation_id == data["correlation_id"]
+            assert record.user_id == mock_update.message.from_user.id
+            assert record.update_type == mock_update.event_type
     
     @pytest.mark.asyncio
     async def test_fsm_transition_logging(self, logging_middleware, mock_update, caplog):
@@ -550,6 +581,7 @@ class TestComprehensiveErrorHandling:
             
             mock_repo.get_by_id.side_effect = Exception("Database error")
             mock_lang.return_value = "en"
+            mock_loc.return_value.settings_buttons = {}
             mock_loc.return_value.SETTINGS = "Settings"
             
             from bot.handlers.profile_handlers import settings_handler
@@ -569,6 +601,7 @@ class TestComprehensiveErrorHandling:
             
             mock_repo.get_by_id.side_effect = Exception("Service unavailable")
             mock_lang.return_value = "en"
+            mock_loc.return_value.settings_buttons = {}
             mock_loc.return_value.SERVICE_UNAVAILABLE = "Service temporarily unavailable"
             
             from bot.handlers.profile_handlers import settings_handler
@@ -715,7 +748,7 @@ class TestArchitectureQuality:
              patch('bot.handlers.profile_handlers.get_user_language') as mock_lang, \
              patch('bot.handlers.profile_handlers.get_localization') as mock_loc, \
              patch('bot.handlers.profile_handlers.is_valid_contact_info') as mock_validator, \
-             patch('bot.handlers.profile_handlers.settings_handler') as mock_settings:
+             patch('bot.handlers.profile_handlers._render_settings') as mock_settings:
             
             # Setup mocks
             mock_lang.return_value = "en"
@@ -8,9 +8,10 @@ from typing import Dict, Any
 from aiogram.types import Update, Message, User, Chat, CallbackQuery
 from aiogram.fsm.context import FSMContext
 
-from bot.middlewares.i18n_middleware import I18nMiddleware, get_i18n_instance, i18n_factory
+from bot.middlewares.i18n_middleware import I18nMiddleware, get_i18n_instance, i18n_factory, validate_locales
 from bot.db.models import User as UserModel
 from bot.db.repositories import UserRepository
+from bot.locales.main import Localization
 
 
 class TestLocalizationCoverage:
@@ -139,6 +140,23 @@ class TestLocalizationCoverage:
         # Should fall back to Russian (default)
         assert "Неизвестная команда" in result or result == "unknown_command"
 
+    def test_translator_plain_and_placeholder_templates(self):
+        """Plain templates are returned verbatim; placeholders are still substituted."""
+        translator = get_i18n_instance()("en")
+        assert translator("unknown_command") == "Unknown command. Use /help to see the list of commands."
+        result = translator("debt_notification", creditor_name="John", amount=500, description="Lunch")
+        assert "John" in result and "{" not in result
+
+    def test_validate_locales_reports_no_gaps(self):
+        """Explicit coverage validation finds no missing keys in the shipped locales."""
+        assert validate_locales() == {}
+
+    def test_translator_cached_per_language(self):
+        """The same gettext closure is returned for repeated calls with one language."""
+        i18n = get_i18n_instance()
+        assert i18n("en") is i18n("en")
+        assert i18n("en") is not i18n("ru")
+
 
 class TestAutomaticLanguageDetection:
     """Test automatic language detection from Telegram user settings."""
@@ -201,7 +219,7 @@ class TestAutomaticLanguageDetection:
             await handler(update, data_dict)
         
         with patch.object(i18n_middleware, '__call__', side_effect=mock_middleware_call):
-            await i18n_middleware(mock_handler, mock_update, data)
+            await i18n_middleware.__call__(mock_handler, mock_update, data)
             
             # Should use Russian language
             assert "_" in data
@@ -239,7 +257,7 @@ class TestAutomaticLanguageDetection:
             await handler(update, data_dict)
         
         with patch.object(i18n_middleware, '__call__', side_effect=mock_middleware_call):
-            await i18n_middleware(mock_handler, mock_update, data)
+            await i18n_middleware.__call__(mock_handler, mock_update, data)
             
             # Should use the user's preference
             assert "_" in data
@@ -265,7 +283,7 @@ class TestAutomaticLanguageDetection:
             await handler(update, data_dict)
         
         with patch.object(i18n_middleware, '__call__', side_effect=mock_middleware_call):
-            await i18n_middleware(mock_handler, mock_update, data)
+            await i18n_middleware.__call__(mock_handler, mock_update, data)
             
             # Should fall back to default language
             assert "_" in data
@@ -321,7 +339,7 @@ class TestAutomaticLanguageDetection:
             await handler(update, data_dict)
         
         with patch.object(i18n_middleware, '__call__', side_effect=mock_middleware_call):
-            await i18n_middleware(mock_handler, update_ru, data)
+            await i18n_middleware.__call__(mock_handler, update_ru, data)
             
             translator = data["_"]
             result = translator("unknown_command")
@@ -422,6 +440,24 @@ class TestManualLanguageSwitching:
         
         mock_user_repository.update_user_language.assert_called_once_with(user_id, new_language)
     
+    @pytest.mark.asyncio
+    async def test_language_shared_store_roundtrip(self):
+        """Test that language preferences are shared through the optional store."""
+        from bot.locales import main as locales_main
+
+        store = AsyncMock()
+        store.get = AsyncMock(return_value=b"ru")
+        state = AsyncMock(spec=FSMContext)
+        state.get_data = AsyncMock(return_value={})
+
+        with patch.object(locales_main, "_language_store", store):
+            await locales_main.remember_user_language(42, "ru")
+            lang = await locales_main.get_user_language(42, state)
+
+        store.set.assert_called_once_with("u:42:lang", "ru")
+        assert lang == "ru"
+        state.update_data.assert_called_once_with(language="ru")
+
     def test_supported_languages_list(self):
         """Test that supported languages are properly defined."""
         supported_languages = ["en", "ru"]
@@ -573,6 +609,27 @@ class TestLocalizationBestPractices:
             assert en_locale[key].strip(), f"English translation for {key} is empty"
             assert ru_locale[key].strip(), f"Russian translation for {key} is empty"
 
+    @pytest.mark.asyncio
+    async def test_warmup_locales_preloads_all_languages(self):
+        """warmup_locales loads every locale file and builds the static keyboards."""
+        from bot.keyboards import profile_kbs
+        from bot.locales import main as locales_main
+
+        with patch.dict(locales_main._LOCALIZATIONS, clear=True), \
+             patch.dict(profile_kbs._TRUSTED_MENU_KBS, clear=True):
+            await locales_main.warmup_locales()
+
+            assert {"en", "ru"} <= set(locales_main._LOCALIZATIONS)
+            assert {"en", "ru"} <= set(profile_kbs._TRUSTED_MENU_KBS)
+
+    def test_localization_get_direct_lookup(self):
+        """Localization.get prefers the exact key and falls back to the default."""
+        loc = Localization("en")
+        assert loc.get("trusted_user_add_prompt") == loc.trusted_user_add_prompt
+        assert loc.get("TRUSTED_USER_ADD_PROMPT") == "Add Trusted User"
+        assert loc.get("settings") == loc.SETTINGS
+        assert loc.get("no_such_key", "fallback") == "fallback"
+
 
 class TestI18nMiddlewareIntegration:
     """Test integration between i18n middleware and user preference management."""
@@ -604,6 +661,98 @@ class TestI18nMiddlewareIntegration:
         from aiogram.types import Update
         return Update.model_construct(update_id=1, message=message)
     
+    def test_language_cache_is_bounded_and_expires(self):
+        """The language cache evicts the least recently used entry and drops expired ones."""
+        from bot.utils.cache import TTLCache
+
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache[1] = "en"
+        cache[2] = "ru"
+        assert cache.get(1) == "en"  # 1 becomes most recently used
+        cache[3] = "en"
+        assert cache.get(2) is None
+        assert len(cache) == 2
+
+        expired = TTLCache(maxsize=2, ttl=0)
+        expired[1] = "en"
+        assert expired.get(1) is None
+        assert len(expired) == 0
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ("/start", True),
+            ("/start ref_42", True),
+            ("/start@budu_dolzhen_bot", True),
+            ("/startover", False),
+            ("/started", False),
+            ("hello /start", False),
+        ],
+    )
+    def test_start_command_detection(self, text, expected):
+        """Only the exact /start command (optionally addressed to the bot) triggers re-detection."""
+        from types import SimpleNamespace
+        from bot.middlewares.i18n_middleware import _is_start_command
+
+        update = Update.model_construct(update_id=1, message=SimpleNamespace(text=text))
+        assert _is_start_command(update) is expected
+
+    @pytest.mark.asyncio
+    async def test_concurrent_language_lookups_share_one_query(self):
+        """Concurrent cache misses for one user issue a single DB lookup."""
+        import asyncio
+        from bot.middlewares import i18n_middleware
+
+        async def slow_lookup(user_id, user_repo):
+            await asyncio.sleep(0.01)
+            return "en"
+
+        with patch('bot.middlewares.i18n_middleware.get_user_language_preference',
+                   side_effect=slow_lookup) as mock_lookup:
+            results = await asyncio.gather(
+                *(i18n_middleware._load_language_preference(42) for _ in range(5))
+            )
+
+        assert results == ["en"] * 5
+        mock_lookup.assert_called_once_with(42, UserRepository)
+        assert 42 not in i18n_middleware._inflight
+
+    @pytest.mark.asyncio
+    async def test_regular_message_uses_db_user_without_extra_queries(self, middleware, mock_update_with_user):
+        """Outside /start the language comes from db_user without touching the database."""
+        from bot.middlewares import i18n_middleware
+
+        db_user = UserModel(user_id=123456789, username="testuser", first_name="Test", language_code="ru")
+        data = {"db_user": db_user}
+        i18n_middleware._lang_cache.clear()
+
+        with patch('bot.middlewares.i18n_middleware.detect_user_language_from_telegram') as mock_detect, \
+             patch('bot.middlewares.i18n_middleware.get_user_language_preference') as mock_lookup:
+            await middleware(AsyncMock(), mock_update_with_user, data)
+
+        mock_detect.assert_not_called()
+        mock_lookup.assert_not_called()
+        assert data["lang_code"] == "ru"
+
+    @pytest.mark.asyncio
+    async def test_update_without_user_skips_language_lookup(self, middleware):
+        """Updates without a sender get the default translator without any lookups."""
+        from bot.middlewares import i18n_middleware
+
+        update = Update.model_construct(update_id=1)
+        data = {}
+        handler = AsyncMock()
+
+        with patch('bot.middlewares.i18n_middleware.detect_user_language_from_telegram') as mock_detect, \
+             patch('bot.middlewares.i18n_middleware.get_user_language_preference') as mock_lookup:
+            await middleware(handler, update, data)
+
+        mock_detect.assert_not_called()
+        mock_lookup.assert_not_called()
+        handler.assert_awaited_once_with(update, data)
+        assert data["lang_code"] == "ru"
+        assert data["_"] is i18n_middleware._default_gettext
+
     @pytest.mark.asyncio
     async def test_middleware_provides_translator_function(self, middleware, mock_update_with_user):
         """Test that middleware provides translator function to handlers."""
@@ -627,7 +776,7 @@ class TestI18nMiddlewareIntegration:
             await handler(update, data_dict)
         
         with patch.object(middleware, '__call__', side_effect=mock_middleware_call):
-            await middleware(mock_handler, mock_update_with_user, data)
+            await middleware.__call__(mock_handler, mock_update_with_user, data)
             
             # Check that translator function is provided
             assert "_" in data
@@ -689,7 +838,7 @@ class TestI18nMiddlewareIntegration:
         
         data_en = {"db_user": db_user_en}
         with patch.object(middleware, '__call__', side_effect=mock_middleware_call_en):
-            await middleware(mock_handler, update, data_en)
+            await middleware.__call__(mock_handler, update, data_en)
         
         translator_en = data_en["_"]
         
@@ -703,7 +852,7 @@ class TestI18nMiddlewareIntegration:
         
         data_ru = {"db_user": db_user_ru}
         with patch.object(middleware, '__call__', side_effect=mock_middleware_call_ru):
-            await middleware(mock_handler, update, data_ru)
+            await middleware.__call__(mock_handler, update, data_ru)
         
         translator_ru = data_ru["_"]
         
@@ -743,8 +892,8 @@ class TestI18nMiddlewareIntegration:
             data2 = {"db_user": db_user}
             
             # Multiple calls with same language should be efficient
-            await middleware(mock_handler, mock_update_with_user, data1)
-            await middleware(mock_handler, mock_update_with_user, data2)
+            await middleware.__call__(mock_handler, mock_update_with_user, data1)
+            await middleware.__call__(mock_handler, mock_update_with_user, data2)
             
             # Both calls should succeed
             assert mock_handler.call_count == 2
@@ -778,7 +927,7 @@ class TestI18nMiddlewareIntegration:
         
         # Should not raise exception, should fall back to default
         with patch.object(middleware, '__call__', side_effect=mock_middleware_call_fallback):
-            await middleware(mock_handler, mock_update_with_user, data)
+            await middleware.__call__(mock_handler, mock_update_with_user, data)
             
             assert "_" in data
             translator = data["_"]
@@ -805,7 +954,7 @@ class TestI18nMiddlewareIntegration:
             await handler(update, data_dict)
         
         with patch.object(middleware, '__call__', side_effect=mock_middleware_call_no_user):
-            await middleware(mock_handler, mock_update_with_user, data)
+            await middleware.__call__(mock_handler, mock_update_with_user, data)
             
             # Should still provide translator with default language
             assert "_" in data
@@ -953,3 +1102,4 @@ class TestLocalizationIntegrationScenarios:
             en_has_emoji = has_emoji(en_text)
             ru_has_emoji = has_emoji(ru_text)
             assert en_has_emoji == ru_has_emoji, f"Emoji usage should be consistent for button {key}"
+
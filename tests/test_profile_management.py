@@ -62,7 +62,9 @@ class TestSettingsHandler:
             
             await settings_handler(message, state)
             
-            state.clear.assert_called_once()
+            state.clear.assert_not_called()
+            state.set_state.assert_called_once_with(ProfileSettings.main)
+            state.set_data.assert_called_once_with({})
             message.answer.assert_called_once()
 
     async def test_settings_handler_displays_menu(self, model_message):
@@ -139,7 +141,7 @@ class TestContactManagement:
              patch('bot.handlers.profile_handlers.get_localization') as mock_loc, \
              patch('bot.handlers.profile_handlers.is_valid_contact_info', return_value=True), \
              patch('bot.handlers.profile_handlers.user_repo') as mock_repo, \
-             patch('bot.handlers.profile_handlers.settings_handler', new_callable=AsyncMock) as mock_settings:
+             patch('bot.handlers.profile_handlers._render_settings', new_callable=AsyncMock) as mock_settings:
             
             # Configure all repository methods that might be called
             mock_repo.update_user_contact = AsyncMock()
@@ -152,8 +154,7 @@ class TestContactManagement:
             
             mock_repo.update_user_contact.assert_called_once_with(123, "john@example.com")
             message.answer.assert_called_once_with("Contact info saved!")
-            state.clear.assert_called_once()
-            mock_settings.assert_called_once_with(message, state)
+            mock_settings.assert_called_once_with(message, "en", state)
 
     async def test_handle_contact_info_invalid_input(self, model_message):
         """Test handling invalid contact info input."""
@@ -239,7 +240,7 @@ class TestReminderSettings:
         with patch('bot.handlers.profile_handlers.get_user_language', return_value='en'), \
              patch('bot.handlers.profile_handlers.get_localization') as mock_loc, \
              patch('bot.handlers.profile_handlers.user_repo') as mock_repo, \
-             patch('bot.handlers.profile_handlers.settings_handler', new_callable=AsyncMock) as mock_settings:
+             patch('bot.handlers.profile_handlers._render_settings', new_callable=AsyncMock) as mock_settings:
             
             # Configure all repository methods that might be called
             mock_repo.update_user_reminders = AsyncMock()
@@ -252,7 +253,7 @@ class TestReminderSettings:
             
             mock_repo.update_user_reminders.assert_called_once_with(123, "15")
             message.answer.assert_called_once_with("Reminder settings saved!")
-            state.clear.assert_called_once()
+            mock_settings.assert_called_once_with(message, "en", state)
 
     async def test_handle_reminders_valid_multiple_days(self, model_message):
         """Test handling valid multiple reminder days."""
@@ -268,7 +269,7 @@ class TestReminderSettings:
         with patch('bot.handlers.profile_handlers.get_user_language', return_value='en'), \
              patch('bot.handlers.profile_handlers.get_localization') as mock_loc, \
              patch('bot.handlers.profile_handlers.user_repo') as mock_repo, \
-             patch('bot.handlers.profile_handlers.settings_handler', new_callable=AsyncMock) as mock_settings:
+             patch('bot.handlers.profile_handlers._render_settings', new_callable=AsyncMock) as mock_settings:
             
             # Configure all repository methods that might be called
             mock_repo.update_user_reminders = AsyncMock()
@@ -281,6 +282,29 @@ class TestReminderSettings:
             
             mock_repo.update_user_reminders.assert_called_once_with(123, "1,15,30")
 
+    async def test_handle_reminders_sorts_and_dedupes_days(self, model_message):
+        """Test that reminder days are stored sorted and without duplicates."""
+        message = model_message(text="20, 5, 05, 20")
+        message.answer = AsyncMock()
+        state = AsyncMock(spec=FSMContext)
+        db_user = UserModel(
+            user_id=123,
+            first_name="John",
+            username="john_doe"
+        )
+
+        with patch('bot.handlers.profile_handlers.get_user_language', return_value='en'), \
+             patch('bot.handlers.profile_handlers.get_localization') as mock_loc, \
+             patch('bot.handlers.profile_handlers.user_repo') as mock_repo, \
+             patch('bot.handlers.profile_handlers._render_settings', new_callable=AsyncMock):
+
+            mock_repo.update_user_reminders = AsyncMock()
+            mock_loc.return_value.reminder_settings_saved = "Reminder settings saved!"
+
+            await handle_reminders_input(message, state, lambda: None, db_user)
+
+            mock_repo.update_user_reminders.assert_called_once_with(123, "5,20")
+
     async def test_handle_reminders_invalid_day_non_numeric(self, model_message):
         """Test handling invalid non-numeric reminder day."""
         message = model_message(text="abc")
@@ -572,6 +596,62 @@ class TestTrustedUsersManagement:
             message.answer.assert_called_once_with("Removed alice from trusted users!")
             state.clear.assert_called_once()
 
+    async def test_handle_trusted_input_add_comma_list(self, model_message):
+        """Test adding several trusted users from a comma-separated list."""
+        message = model_message(text="@alice_1, @bobby_2")
+        message.answer = AsyncMock()
+        state = AsyncMock(spec=FSMContext)
+        state.get_data = AsyncMock(return_value={"action": "add"})
+        db_user = UserModel(
+            user_id=123,
+            first_name="John",
+            username="john_doe"
+        )
+
+        with patch('bot.handlers.profile_handlers.get_user_language', return_value='en'), \
+             patch('bot.handlers.profile_handlers.get_localization') as mock_loc, \
+             patch('bot.handlers.profile_handlers.user_repo') as mock_repo:
+
+            mock_repo.add_trusts_bulk = AsyncMock(return_value=(["alice_1"], []))
+            mock_repo.add_trust = AsyncMock()
+
+            mock_loc.return_value.trusted_user_add_success = "Added {username}"
+            mock_loc.return_value.trusted_user_add_exists = "{username} exists"
+
+            await handle_trusted_input(message, state, lambda: None, db_user)
+
+            mock_repo.add_trusts_bulk.assert_called_once_with(123, ["alice_1", "bobby_2"])
+            mock_repo.add_trust.assert_not_called()
+            message.answer.assert_called_once_with("Added alice_1\nbobby_2 exists")
+            state.clear.assert_called_once()
+
+    async def test_handle_trusted_input_add_comma_list_reports_unknown(self, model_message):
+        """Test that unknown users are reported as not found and case variants answered once."""
+        message = model_message(text="@alice_1, @Bobby_2, @bobby_2, @ghost_3")
+        message.answer = AsyncMock()
+        state = AsyncMock(spec=FSMContext)
+        state.get_data = AsyncMock(return_value={"action": "add"})
+        db_user = UserModel(
+            user_id=123,
+            first_name="John",
+            username="john_doe"
+        )
+
+        with patch('bot.handlers.profile_handlers.get_user_language', return_value='en'), \
+             patch('bot.handlers.profile_handlers.get_localization') as mock_loc, \
+             patch('bot.handlers.profile_handlers.user_repo') as mock_repo:
+
+            mock_repo.add_trusts_bulk = AsyncMock(return_value=(["alice_1"], ["ghost_3"]))
+
+            mock_loc.return_value.trusted_user_add_success = "Added {username}"
+            mock_loc.return_value.trusted_user_add_exists = "{username} exists"
+            mock_loc.return_value.trusted_user_add_not_found = "{username} not found"
+
+            await handle_trusted_input(message, state, lambda: None, db_user)
+
+            message.answer.assert_called_once_with("Added alice_1\nBobby_2 exists\nghost_3 not found")
+            state.clear.assert_called_once()
+
     async def test_handle_trusted_input_invalid_username(self, model_message):
         """Test handling invalid username format."""
         message = model_message(text="invalid_username")
@@ -615,6 +695,19 @@ class TestTrustedUsersManagement:
             validate_username("@user-name")  # Invalid character
 
 
+    async def test_trusted_menu_keyboard_built_once_per_language(self):
+        """Trusted-users menu and cancel keyboards are cached per language."""
+        from bot.keyboards.profile_kbs import trusted_menu_kb, trusted_cancel_kb
+        from bot.locales.main import Localization
+
+        en, ru = Localization("en"), Localization("ru")
+        assert trusted_menu_kb(en) is trusted_menu_kb(Localization("en"))
+        assert trusted_menu_kb(en) is not trusted_menu_kb(ru)
+        assert trusted_cancel_kb(ru) is trusted_cancel_kb(Localization("ru"))
+        callbacks = [row[0].callback_data for row in trusted_menu_kb(en).inline_keyboard]
+        assert callbacks == ["trusted_add", "trusted_remove", "trusted_list", "back_to_settings"]
+
+
 class TestFSMStateTransitions:
     """Test FSM state transitions and error handling."""
 
@@ -640,7 +733,9 @@ class TestFSMStateTransitions:
             
             await back_to_settings_handler(callback, state)
             
-            state.clear.assert_called_once()
+            state.clear.assert_not_called()
+            state.set_state.assert_called_once_with(ProfileSettings.main)
+            state.set_data.assert_called_once_with({})
             callback.message.edit_text.assert_called_once_with(
                 text="Settings Menu",
                 reply_markup=mock_keyboard
@@ -690,7 +785,7 @@ class TestProfileDataPersistence:
              patch('bot.handlers.profile_handlers.get_localization') as mock_loc, \
              patch('bot.handlers.profile_handlers.is_valid_contact_info', return_value=True), \
              patch('bot.handlers.profile_handlers.user_repo') as mock_repo, \
-             patch('bot.handlers.profile_handlers.settings_handler', new_callable=AsyncMock):
+             patch('bot.handlers.profile_handlers._render_settings', new_callable=AsyncMock):
             
             # Configure all repository methods that might be called
             mock_repo.update_user_contact = AsyncMock()
@@ -718,7 +813,7 @@ class TestProfileDataPersistence:
         with patch('bot.handlers.profile_handlers.get_user_language', return_value='en'), \
              patch('bot.handlers.profile_handlers.get_localization') as mock_loc, \
              patch('bot.handlers.profile_handlers.user_repo') as mock_repo, \
-             patch('bot.handlers.profile_handlers.settings_handler', new_callable=AsyncMock):
+             patch('bot.handlers.profile_handlers._render_settings', new_callable=AsyncMock):
             
             # Configure all repository methods that might be called
             mock_repo.update_user_reminders = AsyncMock()
@@ -809,7 +904,7 @@ class TestErrorHandling:
         with patch('bot.handlers.profile_handlers.get_user_language', return_value='en'), \
              patch('bot.handlers.profile_handlers.get_localization') as mock_loc, \
              patch('bot.handlers.profile_handlers.user_repo') as mock_repo, \
-             patch('bot.handlers.profile_handlers.settings_handler', new_callable=AsyncMock):
+             patch('bot.handlers.profile_handlers._render_settings', new_callable=AsyncMock):
             
             # Configure all repository methods that might be called
             mock_repo.update_user_reminders = AsyncMock()
@@ -870,7 +965,7 @@ class TestIntegrationWithRepositories:
             with patch('bot.handlers.profile_handlers.get_user_language', return_value='en'), \
                  patch('bot.handlers.profile_handlers.get_localization') as mock_loc, \
                  patch('bot.handlers.profile_handlers.is_valid_contact_info', return_value=True), \
-                 patch('bot.handlers.profile_handlers.settings_handler', new_callable=AsyncMock):
+                 patch('bot.handlers.profile_handlers._render_settings', new_callable=AsyncMock):
                 
                 mock_loc.return_value.profile_contact_saved = "Saved!"
                 
@@ -4,16 +4,22 @@ import asyncio
 import aiosqlite
 import tempfile
 import os
+import sqlite3
+from zoneinfo import ZoneInfo
 from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 from aiogram import Bot
+from apscheduler.jobstores.memory import MemoryJobStore
 
+from bot.core.notification_queue import notification_queue
+from bot.db.connection import ReadOnlyPool
+from bot.scheduler import jobs
 from bot.scheduler.jobs import send_weekly_reports, check_confirmation_timeouts, send_payday_reminders
 from bot.scheduler.scheduler_manager import SchedulerManager
 from bot.core.notification_service import NotificationService
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(loop_scope="session")
 async def test_db():
     """Create a test database with sample data and proper cleanup."""
     # Use temporary file for better isolation
@@ -94,6 +100,11 @@ async def test_db():
                 "INSERT INTO debts (creditor_id, debtor_id, amount, description, status) VALUES (?, ?, ?, ?, ?)",
                 (1, 3, 1000, "Snack", "rejected")
             )
+            # User 4 owes 1500 cents to user 3 - ACTIVE debt, so user 4 has something to report
+            await db.execute(
+                "INSERT INTO debts (creditor_id, debtor_id, amount, description, status) VALUES (?, ?, ?, ?, ?)",
+                (3, 4, 1500, "Tickets", "active")
+            )
             
             await db.commit()
         
@@ -108,7 +119,7 @@ async def test_db():
             pass  # Ignore cleanup errors
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(loop_scope="session")
 async def mock_bot():
     """Create a mock bot instance with proper async configuration."""
     bot = MagicMock(spec=Bot)
@@ -121,7 +132,7 @@ async def mock_bot():
     return bot
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(loop_scope="session")
 async def mock_notification_service(mock_bot):
     """Create a mock notification service with proper bulk operation support."""
     service = MagicMock(spec=NotificationService)
@@ -161,8 +172,8 @@ class TestWeeklyReports:
             user1_call = next((call for call in calls if call[0][0] == 1), None)
             assert user1_call is not None, "User 1 should receive a weekly report"
             message_text = user1_call[0][1]
-            assert "You owe: 30.00" in message_text
-            assert "Owed to you: 50.00" in message_text
+            assert "You owe: 30\n" in message_text
+            assert "Owed to you: 50\n" in message_text
             assert "Weekly Debt Summary" in message_text
 
         except asyncio.TimeoutError:
@@ -174,7 +185,7 @@ class TestWeeklyReports:
     @patch('bot.scheduler.jobs.get_settings')
     @patch('bot.scheduler.jobs.NotificationService')
     async def test_weekly_reports_zero_amounts(self, mock_notif_class, mock_settings, test_db, mock_bot):
-        """Test weekly reports with users having zero debts."""
+        """Test weekly reports skip users having zero debts."""
         try:
             mock_settings.return_value.db.path = test_db
             mock_notif = AsyncMock()
@@ -187,12 +198,8 @@ class TestWeeklyReports:
             
             await asyncio.wait_for(send_weekly_reports(mock_bot), timeout=10.0)
 
-            calls = mock_notif.send_message.call_args_list
-            user4_call = next((call for call in calls if call[0][0] == 4), None)
-            assert user4_call is not None, "User 4 should receive a weekly report"
-            message_text = user4_call[0][1]
-            assert "You owe: 0.00" in message_text
-            assert "Owed to you: 0.00" in message_text
+            sent_user_ids = {call[0][0] for call in mock_notif.send_message.call_args_list}
+            assert sent_user_ids == {1, 2}, "User 4 has no active debts and should not receive a weekly report"
 
         except asyncio.TimeoutError:
             pytest.fail("Weekly reports zero amounts test timed out")
@@ -264,8 +271,8 @@ class TestWeeklyReports:
                 user1_call = next((call for call in calls if call[0][0] == 1), None)
                 assert user1_call is not None, "User 1 should receive a debt calculation report"
                 message_text = user1_call[0][1]
-                assert "You owe: 100.00" in message_text
-                assert "Owed to you: 200.00" in message_text
+                assert "You owe: 100\n" in message_text
+                assert "Owed to you: 200\n" in message_text
                 
         except asyncio.TimeoutError:
             pytest.fail("Debt calculation accuracy test timed out")
@@ -329,6 +336,27 @@ class TestPaydayReminders:
         sent_user_ids = {call[0][0] for call in mock_notif.send_message.call_args_list}
         assert sent_user_ids == {1, 5}
     
+    @pytest.mark.asyncio
+    @patch('bot.scheduler.jobs.get_settings')
+    @patch('bot.scheduler.jobs.NotificationService')
+    @patch('bot.scheduler.jobs.date')
+    async def test_payday_reminders_loose_formatting(self, mock_date, mock_notif_class, mock_settings, test_db, mock_bot):
+        mock_date.today.return_value.day = 5
+        async with aiosqlite.connect(test_db) as db:
+            await db.executemany(
+                "INSERT INTO users (user_id, username, payday_days) VALUES (?, ?, ?)",
+                [(5, "eve", "03, 05"), (6, "frank", "15,25"), (7, "grace", "x5,50")],
+            )
+            await db.commit()
+
+        mock_settings.return_value.db.path = test_db
+        mock_notif = AsyncMock()
+        mock_notif_class.return_value = mock_notif
+
+        await send_payday_reminders(mock_bot)
+        sent_user_ids = {call[0][0] for call in mock_notif.send_message.call_args_list}
+        assert sent_user_ids == {2, 5}
+
     @pytest.mark.asyncio
     @patch('bot.scheduler.jobs.get_settings')
     @patch('bot.scheduler.jobs.NotificationService')
@@ -393,6 +421,27 @@ class TestConfirmationTimeouts:
         assert "automatically rejected" in call_args[0][1]
         assert "@bob" in call_args[0][1]
     
+    @pytest.mark.asyncio
+    @patch('bot.scheduler.jobs.get_settings')
+    @patch('bot.scheduler.jobs.NotificationService')
+    async def test_confirmation_timeout_overlapping_runs_notify_once(self, mock_notif_class, mock_settings, test_db, mock_bot):
+        expired_time = datetime.now(timezone.utc) - timedelta(hours=24)
+        async with aiosqlite.connect(test_db) as db:
+            await db.execute("DELETE FROM debts")
+            await db.execute(
+                "INSERT INTO debts (debt_id, creditor_id, debtor_id, amount, status, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (110, 1, 2, 5000, "pending", expired_time.isoformat())
+            )
+            await db.commit()
+
+        mock_settings.return_value.db.path = test_db
+        mock_notif = AsyncMock()
+        mock_notif_class.return_value = mock_notif
+
+        await asyncio.gather(check_confirmation_timeouts(mock_bot), check_confirmation_timeouts(mock_bot))
+
+        mock_notif.send_message.assert_called_once()
+
     @pytest.mark.asyncio
     @patch('bot.scheduler.jobs.get_settings')
     @patch('bot.scheduler.jobs.NotificationService')
@@ -531,25 +580,22 @@ class TestSchedulerPersistence:
         assert manager._scheduler.state == 0
     
     @patch('bot.scheduler.scheduler_manager.get_settings')
-    def test_scheduler_job_persistence(self, mock_settings):
+    def test_scheduler_uses_memory_jobstore(self, mock_settings):
         mock_settings.return_value.db.path = "/test/path/database.db"
         mock_settings.return_value.scheduler.timezone = "UTC"
         
         manager = SchedulerManager()
         jobstores = manager._scheduler.jobstores
         assert 'default' in jobstores
-        assert hasattr(jobstores['default'], 'url')
-        
-        default_store = jobstores['default']
-        assert hasattr(default_store, 'jobs')
-        assert hasattr(default_store, 'add_job')
-        assert hasattr(default_store, 'remove_job')
-        assert hasattr(default_store, 'get_all_jobs')
-        
-        test_job = MagicMock()
-        test_job.id = "test_job_1"
-        default_store.add_job(test_job)
-        assert test_job.id in default_store.jobs
+        assert isinstance(jobstores['default'], MemoryJobStore)
+
+    @patch('bot.scheduler.scheduler_manager.get_settings')
+    def test_scheduler_timezone_is_zoneinfo(self, mock_settings):
+        mock_settings.return_value.db.path = "/test/path/database.db"
+        mock_settings.return_value.scheduler.timezone = "Europe/Moscow"
+
+        manager = SchedulerManager()
+        assert manager._scheduler.timezone == ZoneInfo("Europe/Moscow")
 
 
 class TestUserOptOut:
@@ -628,6 +674,51 @@ class TestBulkNotifications:
             assert all(diff >= 0 for diff in time_diffs)
             assert any(diff > 0.005 for diff in time_diffs)
     
+    @pytest.mark.asyncio
+    @patch('bot.scheduler.jobs.get_settings')
+    @patch('bot.scheduler.jobs.NotificationService')
+    async def test_bulk_notifications_overlap(self, mock_notif_class, mock_settings, test_db, mock_bot):
+        mock_settings.return_value.db.path = test_db
+        mock_notif = AsyncMock()
+        mock_notif_class.return_value = mock_notif
+
+        in_flight = 0
+        max_in_flight = 0
+        async def slow_send_message(*args, **kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.2)
+            in_flight -= 1
+            return True
+
+        mock_notif.send_message.side_effect = slow_send_message
+
+        await asyncio.wait_for(send_weekly_reports(mock_bot), timeout=15.0)
+
+        assert mock_notif.send_message.call_count == 3
+        assert max_in_flight > 1
+
+    @pytest.mark.asyncio
+    @patch('bot.scheduler.jobs.get_settings')
+    @patch('bot.scheduler.jobs.NotificationService')
+    async def test_jobs_enqueue_when_notification_queue_runs(self, mock_notif_class, mock_settings, test_db, mock_bot):
+        mock_settings.return_value.db.path = test_db
+        job_notif = AsyncMock()
+        mock_notif_class.return_value = job_notif
+        queue_notif = AsyncMock()
+        queue_notif.send_message = AsyncMock(return_value=True)
+
+        notification_queue.start(queue_notif)
+        try:
+            await asyncio.wait_for(send_weekly_reports(mock_bot), timeout=10.0)
+            job_notif.send_message.assert_not_called()
+            await asyncio.wait_for(notification_queue.join(), timeout=5.0)
+        finally:
+            await notification_queue.stop()
+
+        assert {call[0][0] for call in queue_notif.send_message.call_args_list} == {1, 2, 4}
+
     @pytest.mark.asyncio
     @patch('bot.scheduler.jobs.get_settings')
     @patch('bot.scheduler.jobs.NotificationService')
@@ -670,6 +761,21 @@ class TestJobSchedulingAndCleanup:
             assert hasattr(job, 'func')
             assert job.id is not None
     
+    @patch('bot.scheduler.scheduler_manager.get_settings')
+    def test_job_registration_is_idempotent(self, mock_settings):
+        mock_settings.return_value.db.path = "/test/path/database.db"
+        mock_settings.return_value.scheduler.timezone = "UTC"
+
+        manager = SchedulerManager()
+        manager.start()
+        manager.start()
+
+        jobs = manager._scheduler.jobs
+        assert set(jobs) == {"check_confirmation_timeouts", "send_weekly_reports"}
+        for job in jobs.values():
+            assert job.kwargs["replace_existing"] is True
+            assert job.kwargs["max_instances"] == 1
+
     @pytest.mark.asyncio
     async def test_job_execution_isolation(self):
         try:
@@ -688,6 +794,60 @@ class TestJobSchedulingAndCleanup:
         except Exception as e:
             pytest.fail(f"Job execution isolation test failed: {e}")
     
+    @pytest.mark.asyncio
+    @patch('bot.scheduler.jobs.get_settings')
+    @patch('bot.scheduler.jobs.NotificationService')
+    async def test_jobs_switch_database_to_wal(self, mock_notif_class, mock_settings, test_db, mock_bot):
+        mock_settings.return_value.db.path = test_db
+        mock_notif_class.return_value = AsyncMock()
+
+        await asyncio.wait_for(send_weekly_reports(mock_bot), timeout=10.0)
+
+        async with aiosqlite.connect(test_db) as db:
+            cursor = await db.execute("PRAGMA journal_mode")
+            assert (await cursor.fetchone())[0] == "wal"
+
+    @pytest.mark.asyncio
+    @patch('bot.scheduler.jobs.get_settings')
+    @patch('bot.scheduler.jobs.NotificationService')
+    async def test_jobs_reuse_one_connection(self, mock_notif_class, mock_settings, test_db, mock_bot):
+        mock_settings.return_value.db.path = test_db
+        mock_notif_class.return_value = AsyncMock()
+
+        await send_weekly_reports(mock_bot)
+        first = await jobs.get_db(test_db)
+        await send_payday_reminders(mock_bot)
+        await check_confirmation_timeouts(mock_bot)
+        assert await jobs.get_db(test_db) is first
+
+        await jobs.close_db()
+        assert await jobs.get_db(test_db) is not first
+
+    @pytest.mark.asyncio
+    async def test_job_db_path_change_replaces_writer_and_stale_read_pool(self, test_db, tmp_path):
+        async with jobs._read_db(test_db):
+            pass
+        writer, pool = await jobs.get_db(test_db), jobs._read_pool
+        assert pool is not None and pool.path == test_db
+
+        other = await jobs.get_db(str(tmp_path / "other.db"))
+
+        assert other is not writer
+        assert jobs._read_pool is None
+
+    @pytest.mark.asyncio
+    async def test_read_only_pool_rejects_writes(self, test_db):
+        await jobs.get_db(test_db)
+        pool = ReadOnlyPool(test_db, size=2)
+        try:
+            async with pool.acquire() as conn:
+                cursor = await conn.execute("SELECT COUNT(*) FROM users")
+                assert (await cursor.fetchone())[0] > 0
+                with pytest.raises(sqlite3.OperationalError):
+                    await conn.execute("DELETE FROM users")
+        finally:
+            await pool.close()
+
     @pytest.mark.asyncio
     @patch('bot.scheduler.jobs.logger')
     async def test_job_logging(self, mock_logger, mock_bot):
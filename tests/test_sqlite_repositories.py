@@ -270,7 +270,7 @@ def temp_db_sync():
             logger.error(f"Error during sync test file cleanup: {e}")
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(loop_scope="session")
 async def temp_db():
     """Create a temporary database for async tests with proper cleanup, validation, and unique naming."""
     # Generate unique database file name to prevent conflicts
@@ -393,7 +393,7 @@ async def temp_db():
         logger.error(f"Error during final file cleanup: {e}")
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(loop_scope="session")
 async def initialized_db(temp_db):
     """Initialize database with schema and verify successful initialization with enhanced error handling."""
     max_retries = 3
@@ -500,6 +500,15 @@ class TestDatabaseInitialization:
             fk_enabled = row[0] if row else 0
             assert fk_enabled == 1
 
+    async def test_synchronous_level_applied(self, temp_db):
+        """Test that pool connections use the configured synchronous level (OFF under the test suite)."""
+        await _initialize_database()
+
+        async with get_connection() as conn:
+            cursor = await conn.execute("PRAGMA synchronous")
+            row = await cursor.fetchone()
+            assert row[0] == 0
+
     async def test_schema_file_not_found_error(self, temp_db):
         """Test error handling when schema file is missing."""
         with patch("bot.db.connection.SCHEMA_FILE", Path("/nonexistent/schema.sql")):
@@ -573,6 +582,19 @@ class TestUserRepository:
         assert retrieved_user.user_id == created_user.user_id
         assert retrieved_user.username == "testuser"
 
+    async def test_get_by_id_cache_evicted_on_update(self, initialized_db):
+        """Test cached users are refreshed after a write through the repository."""
+        created_user = await UserRepository.add("testuser")
+        first = await UserRepository.get_by_id(created_user.user_id)
+        first.contact = "mutated locally"
+
+        cached = await UserRepository.get_by_id(created_user.user_id)
+        assert cached.contact is None
+
+        await UserRepository.update_user_contact(created_user.user_id, "card 1234")
+        refreshed = await UserRepository.get_by_id(created_user.user_id)
+        assert refreshed.contact == "card 1234"
+
     async def test_get_by_id_nonexistent_user(self, initialized_db):
         """Test retrieving nonexistent user by ID."""
         user = await UserRepository.get_by_id(99999)
@@ -630,6 +652,44 @@ class TestUserRepository:
         trusts = await UserRepository.trusts(user1.user_id, "user2")
         assert trusts is True
 
+    async def test_add_trusts_bulk(self, initialized_db):
+        """Test bulk trust addition skips unknown and already trusted users."""
+        user1 = await UserRepository.add("user1")
+        await UserRepository.add("user2")
+        await UserRepository.add("user3")
+        await UserRepository.add_trust(user1.user_id, "user2")
+
+        added, not_found = await UserRepository.add_trusts_bulk(user1.user_id, ["user2", "USER3", "nonexistent"])
+
+        assert added == ["user3"]
+        assert not_found == ["nonexistent"]
+        assert await UserRepository.trusts(user1.user_id, "user2") is True
+        assert await UserRepository.trusts(user1.user_id, "user3") is True
+
+    async def test_remove_trusts_bulk(self, initialized_db):
+        """Test bulk trust removal reports only removed users."""
+        user1 = await UserRepository.add("user1")
+        await UserRepository.add("user2")
+        await UserRepository.add("user3")
+        await UserRepository.add_trust(user1.user_id, "user2")
+
+        removed = await UserRepository.remove_trusts_bulk(user1.user_id, ["user2", "user3"])
+
+        assert removed == ["user2"]
+        assert await UserRepository.trusts(user1.user_id, "user2") is False
+
+    async def test_get_users_in_bulk(self, initialized_db):
+        """Test bulk lookups by username and by id return only existing users."""
+        user1 = await UserRepository.add("user1")
+        user2 = await UserRepository.add("user2")
+
+        by_name = await UserRepository.get_by_usernames(["USER1", "user2", "user1", "ghost"])
+        by_id = await UserRepository.get_by_ids([user2.user_id, 999999])
+
+        assert set(by_name) == {"user1", "user2"}
+        assert by_name["user1"].user_id == user1.user_id
+        assert list(by_id) == [user2.user_id]
+
     async def test_trusts_existing_relationship(self, initialized_db):
         """Test checking existing trust relationship."""
         user1 = await UserRepository.add("user1")
@@ -13,6 +13,7 @@ Tests cover:
 
 import pytest
 import asyncio
+import json
 from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -40,9 +41,9 @@ class TestAutomaticDebtRejection:
         recent_debt, old_debt, unregistered_debt = sample_debts
 
         # Mock database connection and queries
-        with patch("aiosqlite.connect") as mock_connect:
+        with patch("aiosqlite.connect", new_callable=AsyncMock) as mock_connect:
             mock_db = AsyncMock()
-            mock_connect.return_value.__aenter__.return_value = mock_db
+            mock_connect.return_value = mock_db
             mock_db.row_factory = None
 
             # Mock cursor for expired debts query
@@ -78,15 +79,15 @@ class TestAutomaticDebtRejection:
 
                 await check_confirmation_timeouts(mock_bot_instance)
 
-            # Verify database operations - SELECT query + UPDATE queries for each debt
+            # Verify database operations - SELECT query + one bulk UPDATE for all debts
             select_calls = [call for call in mock_db.execute.call_args_list if "SELECT" in str(call[0][0])]
             update_calls = [call for call in mock_db.execute.call_args_list if "UPDATE" in str(call[0][0])]
 
             assert len(select_calls) >= 1  # At least one SELECT for expired debts
-            assert len(update_calls) == 2  # Two UPDATE calls for the two expired debts
+            assert len(update_calls) == 1  # One UPDATE covering both expired debts
 
-            # Verify commit was called for each successful update
-            assert mock_db.commit.call_count == 2
+            # Verify the bulk update was committed once
+            assert mock_db.commit.call_count == 1
 
             # Verify notifications were sent to creditors
             assert notification_service.send_message.call_count == 2
@@ -105,9 +106,9 @@ class TestAutomaticDebtRejection:
         debtor_id = 2
         debtor_username = "user2"
 
-        with patch("aiosqlite.connect") as mock_connect:
+        with patch("aiosqlite.connect", new_callable=AsyncMock) as mock_connect:
             mock_db = AsyncMock()
-            mock_connect.return_value.__aenter__.return_value = mock_db
+            mock_connect.return_value = mock_db
             mock_db.row_factory = None
 
             mock_cursor = AsyncMock()
@@ -152,9 +153,9 @@ class TestAutomaticDebtRejection:
         # Await the async fixture
         mock_debt_repo, mock_user_repo = mock_repositories
 
-        with patch("aiosqlite.connect") as mock_connect:
+        with patch("aiosqlite.connect", new_callable=AsyncMock) as mock_connect:
             mock_db = AsyncMock()
-            mock_connect.return_value.__aenter__.return_value = mock_db
+            mock_connect.return_value = mock_db
             mock_db.row_factory = None
 
             mock_cursor = AsyncMock()
@@ -174,7 +175,7 @@ class TestAutomaticDebtRejection:
     @pytest.mark.asyncio
     async def test_error_handling_in_timeout_check(self, mock_notification_service):
         """Test error handling during timeout check process."""
-        with patch("aiosqlite.connect") as mock_connect:
+        with patch("aiosqlite.connect", new_callable=AsyncMock) as mock_connect:
             mock_connect.side_effect = Exception("Database connection failed")
 
             # Should not raise exception
@@ -200,9 +201,9 @@ class TestUnregisteredUserHandling:
         unregistered_debtor_id = 999  # User who hasn't started the bot
         debt_id = 456
 
-        with patch("aiosqlite.connect") as mock_connect:
+        with patch("aiosqlite.connect", new_callable=AsyncMock) as mock_connect:
             mock_db = AsyncMock()
-            mock_connect.return_value.__aenter__.return_value = mock_db
+            mock_connect.return_value = mock_db
             mock_db.row_factory = None
 
             mock_cursor = AsyncMock()
@@ -533,9 +534,9 @@ class TestTimeoutNotificationDelivery:
         notification_service._retry_attempts = 3
         notification_service._throttle_delay = 0.01
 
-        with patch("aiosqlite.connect") as mock_connect:
+        with patch("aiosqlite.connect", new_callable=AsyncMock) as mock_connect:
             mock_db = AsyncMock()
-            mock_connect.return_value.__aenter__.return_value = mock_db
+            mock_connect.return_value = mock_db
             mock_db.row_factory = None
 
             mock_cursor = AsyncMock()
@@ -596,9 +597,9 @@ class TestTimeoutNotificationDelivery:
         notification_service.send_message = AsyncMock(return_value=True)
         notification_service.process_queued_notifications = AsyncMock()
 
-        with patch("aiosqlite.connect") as mock_connect:
+        with patch("aiosqlite.connect", new_callable=AsyncMock) as mock_connect:
             mock_db = AsyncMock()
-            mock_connect.return_value.__aenter__.return_value = mock_db
+            mock_connect.return_value = mock_db
             mock_db.row_factory = None
 
             mock_cursor = AsyncMock()
@@ -622,12 +623,13 @@ class TestTimeoutNotificationDelivery:
             expected_creditor_ids = [debt["creditor_id"] for debt in debts_data]
             assert set(creditor_ids) == set(expected_creditor_ids)
 
-            # Verify all debts were updated in database
+            # Verify all debts were updated in one statement
             update_calls = [call for call in mock_db.execute.call_args_list if "UPDATE" in str(call[0][0])]
-            assert len(update_calls) == len(debts_data)
+            assert len(update_calls) == 1
+            assert json.loads(update_calls[0][0][1][1]) == [debt["debt_id"] for debt in debts_data]
 
-            # Verify commits were called for each update
-            assert mock_db.commit.call_count == len(debts_data)
+            # Verify the bulk update was committed once
+            assert mock_db.commit.call_count == 1
 
     @pytest.mark.asyncio
     async def test_notification_rate_limiting(self, mock_notification_service):
@@ -655,9 +657,9 @@ class TestTimeoutNotificationDelivery:
         notification_service.process_queued_notifications = AsyncMock()
         notification_service._throttle_delay = 0.01  # Configure rate limiting
 
-        with patch("aiosqlite.connect") as mock_connect:
+        with patch("aiosqlite.connect", new_callable=AsyncMock) as mock_connect:
             mock_db = AsyncMock()
-            mock_connect.return_value.__aenter__.return_value = mock_db
+            mock_connect.return_value = mock_db
             mock_db.row_factory = None
 
             mock_cursor = AsyncMock()
@@ -682,9 +684,9 @@ class TestTimeoutNotificationDelivery:
             # Verify all notifications were sent
             assert notification_service.send_message.call_count == len(large_debt_list)
 
-            # Verify all database operations completed
+            # Verify all debts were rejected by a single bulk update
             update_calls = [call for call in mock_db.execute.call_args_list if "UPDATE" in str(call[0][0])]
-            assert len(update_calls) == len(large_debt_list)
+            assert len(update_calls) == 1
 
 
 class TestEdgeCases:
@@ -722,9 +724,9 @@ class TestEdgeCases:
     @pytest.mark.asyncio
     async def test_database_transaction_rollback(self):
         """Test proper transaction handling during errors."""
-        with patch("aiosqlite.connect") as mock_connect:
+        with patch("aiosqlite.connect", new_callable=AsyncMock) as mock_connect:
             mock_db = AsyncMock()
-            mock_connect.return_value.__aenter__.return_value = mock_db
+            mock_connect.return_value = mock_db
             mock_db.row_factory = None
 
             mock_cursor = AsyncMock()
@@ -762,3 +764,4 @@ class TestEdgeCases:
 
             # Verify rollback behavior - commit should not be called due to error
             mock_db.commit.assert_not_called()
+            mock_db.rollback.assert_awaited_once()
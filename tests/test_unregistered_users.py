@@ -8,7 +8,7 @@ from aiogram.types import Update, MessageEntity
 from aiogram.enums import MessageEntityType
 from aiogram.exceptions import TelegramAPIError
 
-from bot.middlewares.user_middleware import UserMiddleware
+from bot.middlewares.user_middleware import ThreadSafeNotificationQueue, UserMiddleware
 from bot.core.notification_service import NotificationService
 from bot.db.models import User as UserModel
 from bot.db.repositories import UserRepository, _acquire_connection
@@ -20,7 +20,7 @@ from tests.conftest import make_mutable_message
 pytestmark = pytest.mark.asyncio
 
 
-@pytest_asyncio.fixture(autouse=True)
+@pytest_asyncio.fixture(autouse=True, loop_scope="session")
 async def _clear_queue():
     if hasattr(UserMiddleware, "clear_all_notifications"):
         await UserMiddleware.clear_all_notifications()
@@ -48,6 +48,8 @@ class TestUnregisteredUserHandling:
             # Configure class methods directly since UserRepository uses @classmethod
             mock_repo.get_by_id = AsyncMock(return_value=None)
             mock_repo.get_by_username = AsyncMock(return_value=None)
+            mock_repo.get_by_usernames = AsyncMock(return_value={})
+            mock_repo.get_by_ids = AsyncMock(return_value={})
             mock_repo.add = AsyncMock(return_value=None)
             mock_repo.update_user_language = AsyncMock(return_value=None)
             mock_repo.update_user_contact = AsyncMock(return_value=None)
@@ -131,7 +133,7 @@ class TestUnregisteredUserDetection(TestUnregisteredUserHandling):
         """Test detection of unregistered user through @mention."""
         # Setup - ensure proper mock configuration
         mock_user_repo.get_by_id.return_value = registered_user
-        mock_user_repo.get_by_username.return_value = None  # Unregistered user
+        mock_user_repo.get_by_usernames.return_value = {}  # Unregistered user
 
         handler = AsyncMock()
         data = {"bot": mock_bot, "event_from_user": mock_update_with_mention.message.from_user}
@@ -142,7 +144,7 @@ class TestUnregisteredUserDetection(TestUnregisteredUserHandling):
 
         # Verify repository calls were made
         mock_user_repo.get_by_id.assert_called_with(registered_user.user_id)
-        mock_user_repo.get_by_username.assert_called_with("unregistered_user")
+        mock_user_repo.get_by_usernames.assert_called_once_with(["unregistered_user"])
 
         # Verify handler was called (middleware should continue processing)
         handler.assert_called_once()
@@ -199,7 +201,7 @@ class TestUnregisteredUserDetection(TestUnregisteredUserHandling):
         )
 
         mock_user_repo.get_by_id.return_value = registered_user
-        mock_user_repo.get_by_username.return_value = another_user
+        mock_user_repo.get_by_usernames.return_value = {"unregistered_user": another_user}
 
         handler = AsyncMock()
         data = {"bot": mock_bot, "event_from_user": mock_update_with_mention.message.from_user}
@@ -213,7 +215,7 @@ class TestUnregisteredUserDetection(TestUnregisteredUserHandling):
 
         # Verify repository calls were made
         mock_user_repo.get_by_id.assert_called_with(registered_user.user_id)
-        mock_user_repo.get_by_username.assert_called_with("unregistered_user")
+        mock_user_repo.get_by_usernames.assert_called_once_with(["unregistered_user"])
 
 
 class TestDelayedNotificationDelivery(TestUnregisteredUserHandling):
@@ -431,6 +433,21 @@ class TestTimeoutHandling(TestUnregisteredUserHandling):
             # For testing, we verify the method works without errors
             assert isinstance(remaining_count, int)
 
+    async def test_expired_cleanup_is_amortized_across_inserts(self):
+        """Inserts sweep expired notifications at most once per cleanup interval."""
+        queue = ThreadSafeNotificationQueue(max_queue_size=5, ttl_seconds=3600)
+        with patch.object(queue, "_cleanup_expired", wraps=queue._cleanup_expired) as cleanup:
+            for i in range(10):
+                await queue.add_notification("user", AsyncMock(), MagicMock(), {"index": i})
+            cleanup.assert_not_called()
+
+            queue._last_cleanup -= queue._cleanup_interval
+            await queue.add_notification("user", AsyncMock(), MagicMock(), {"index": 10})
+            cleanup.assert_called_once()
+
+        stats = await queue.get_queue_stats()
+        assert stats == {"user": 5}
+
     async def test_notification_queue_size_limits(self, user_middleware):
         """Test that notification queues don't grow unbounded."""
         # Setup many notifications for one user (if queue system exists)
@@ -565,7 +582,7 @@ class TestRegistrationStateTracking(TestUnregisteredUserHandling):
         """Test tracking of users who have been mentioned but not started bot."""
         # Setup
         mock_user_repo.get_by_id.return_value = registered_user
-        mock_user_repo.get_by_username.return_value = None  # User not found = invited state
+        mock_user_repo.get_by_usernames.return_value = {}  # User not found = invited state
 
         from_user = model_user(
             id=registered_user.user_id,
@@ -592,7 +609,7 @@ class TestRegistrationStateTracking(TestUnregisteredUserHandling):
 
         # Verify repository calls
         mock_user_repo.get_by_id.assert_called_with(registered_user.user_id)
-        mock_user_repo.get_by_username.assert_called_with("invited_user")
+        mock_user_repo.get_by_usernames.assert_called_once_with(["invited_user"])
 
         # Verify handler was called
         handler.assert_called_once()